@@ -6,56 +6,233 @@ Flask 기반 웹 UI로 MSG 파일을 EML로 변환합니다.
 
 실행: python app.py
 접속: http://localhost:5000
+
+운영 환경 (gunicorn, 스레드 워커):
+    gunicorn 'app:create_app()' --worker-class gthread -w 4 --threads 8 -b 0.0.0.0:5001
 """
 
+import io
 import os
+import time
 import uuid
+import zlib
 import zipfile
 import tempfile
 import shutil
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
+from flask import Flask, Request, Response, render_template, request, jsonify, send_file, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 
+# 가속 DEFLATE (선택사항): isal이 있으면 ZIP 항목 미리 압축에 사용
+# (zipfile 모듈 자체는 건드리지 않음 - 다른 ZipFile 사용처에 영향 없도록)
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# 고속 JSON (선택사항): orjson이 있으면 API 응답/요청 JSON 처리에 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 기존 변환기 import
 from msg_to_eml import MSGtoEMLConverter
 
+class UploadRequest(Request):
+    """
+    업로드 파일을 크기에 따라 메모리 또는 디스크에 바로 받는 요청 클래스
+    
+    Werkzeug 기본 구현(SpooledTemporaryFile)은 메모리에 먼저 쌓은 뒤
+    500KB를 넘으면 디스크로 옮기므로, 큰 업로드는 처음부터 임시 파일로 받음
+    """
+    
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        if total_content_length is None or total_content_length > UPLOAD_MEMORY_LIMIT:
+            return tempfile.TemporaryFile('wb+')
+        return io.BytesIO()
+
+
 app = Flask(__name__)
+app.request_class = UploadRequest
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB 제한
 
+# 프런트 웹 서버(Apache mod_xsendfile, lighttpd 등) 뒤에서 실행할 때
+# USE_X_SENDFILE=1 로 설정하면 파일 내용 대신 X-Sendfile 헤더만 보내고
+# 실제 전송은 웹 서버가 커널 sendfile로 처리함
+# (웹 서버가 CONVERTED_FOLDER 경로를 읽을 수 있어야 함)
+app.config['USE_X_SENDFILE'] = bool(os.environ.get('USE_X_SENDFILE'))
+
+
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """orjson 기반 JSON 처리 (jsonify, request.get_json에 적용)"""
+        
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    app.json = OrjsonProvider(app)
+
 # 임시 파일 저장 디렉토리
-UPLOAD_FOLDER = Path(tempfile.gettempdir()) / 'msg_to_eml_uploads'
 CONVERTED_FOLDER = Path(tempfile.gettempdir()) / 'msg_to_eml_converted'
 
 # 폴더 생성
-UPLOAD_FOLDER.mkdir(exist_ok=True)
 CONVERTED_FOLDER.mkdir(exist_ok=True)
 
+# 이 크기 이하의 요청만 업로드 파일을 메모리에 받음
+UPLOAD_MEMORY_LIMIT = 500 * 1024  # 500KB
+
+# 탐색 불가능한 업로드 스트림을 메모리에 둘 최대 크기 (초과 시 임시 파일)
+UPLOAD_SPOOL_SIZE = 16 * 1024 * 1024  # 16MB
+
+# 오래된 파일 정리 주기 (초)
+CLEANUP_INTERVAL = 600  # 10분
+
+# 변환 세션 만료 시간 (초) / 최대 개수
+SESSION_TTL = 3600  # 1시간 (cleanup_old_files 기준과 동일)
+SESSION_MAX = 10000
+
+
+class SessionStore:
+    """
+    만료 시간과 최대 개수가 있는 변환 세션 저장소 (메모리)
+    
+    가장 오래된 세션부터 제거되며, 만료된 세션은 조회되지 않음
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()  # file_id -> (만료 시각, 세션)
+        self._lock = threading.Lock()
+    
+    def _expire(self, now: float):
+        """만료된 세션 제거 (삽입 순서 = 만료 순서)"""
+        while self._items:
+            file_id, (expires, _) = next(iter(self._items.items()))
+            if expires > now:
+                break
+            del self._items[file_id]
+    
+    def get(self, file_id: str):
+        with self._lock:
+            self._expire(time.time())
+            item = self._items.get(file_id)
+            return item[1] if item else None
+    
+    def set(self, file_id: str, session: dict):
+        with self._lock:
+            now = time.time()
+            self._expire(now)
+            self._items.pop(file_id, None)
+            self._items[file_id] = (now + self.ttl, session)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+    
+    def pop(self, file_id: str):
+        with self._lock:
+            item = self._items.pop(file_id, None)
+            return item[1] if item else None
+
+
 # 변환 세션 저장 (메모리)
-conversion_sessions = {}
+conversion_sessions = SessionStore(SESSION_MAX, SESSION_TTL)
+
+# ZIP 스트리밍 시 한 번에 내보낼 최소 크기 (작은 쓰기를 모아서 전송)
+ZIP_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 다운로드는 일회성이므로 압축률보다 속도 우선
+ZIP_COMPRESS_LEVEL = 1
+
+# ZIP 항목을 미리 압축할 스레드 수 (zlib/isal은 압축 중 GIL을 해제함)
+ZIP_WORKERS = min(8, os.cpu_count() or 1)
+
+# 이 크기보다 큰 파일은 메모리에 올리지 않고 ZipFile로 직접 압축
+ZIP_PRECOMPRESS_LIMIT = 32 * 1024 * 1024  # 32MB
+
+# 이 크기보다 작은 파일은 압축 이득이 거의 없으므로 무압축(STORED)으로 저장
+ZIP_STORE_LIMIT = 4096
 
 
 def cleanup_old_files():
     """1시간 이상 된 파일 정리"""
-    import time
     current_time = time.time()
     
-    for folder in [UPLOAD_FOLDER, CONVERTED_FOLDER]:
-        for file_path in folder.iterdir():
-            if file_path.is_file():
-                file_age = current_time - file_path.stat().st_mtime
+    # DirEntry는 stat 결과를 캐시하므로 파일마다 stat을 한 번만 호출
+    with os.scandir(CONVERTED_FOLDER) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                file_age = current_time - entry.stat(follow_symlinks=False).st_mtime
                 if file_age > 3600:  # 1시간
                     try:
-                        file_path.unlink()
+                        os.unlink(entry.path)
                     except:
                         pass
 
 
+def _cleanup_loop():
+    """백그라운드에서 주기적으로 오래된 파일 정리"""
+    while True:
+        time.sleep(CLEANUP_INTERVAL)
+        try:
+            cleanup_old_files()
+        except Exception:
+            pass
+
+
+_cleanup_thread = None
+_cleanup_lock = threading.Lock()
+
+
+def _start_cleanup_thread():
+    """정리 스레드 시작 (프로세스마다 한 번만)"""
+    global _cleanup_thread
+    with _cleanup_lock:
+        if _cleanup_thread is None:
+            _cleanup_thread = threading.Thread(target=_cleanup_loop, name="cleanup", daemon=True)
+            _cleanup_thread.start()
+
+
+@app.before_request
+def _ensure_cleanup_thread():
+    """
+    첫 요청에서 정리 스레드 시작
+    
+    create_app()을 거치지 않는 실행 방식(flask run, gunicorn app:app)에서도
+    오래된 파일이 정리되도록 함 (이후 요청은 전역 변수 확인만)
+    """
+    if _cleanup_thread is None:
+        _start_cleanup_thread()
+
+
+def create_app() -> Flask:
+    """
+    앱 팩토리 (gunicorn 등 WSGI 서버용)
+    
+    워커 프로세스마다 한 번씩 정리 스레드를 시작하고 앱을 반환
+    """
+    _start_cleanup_thread()
+    return app
+
+# 렌더링된 메인 페이지 (최초 요청 시 생성)
+_index_html = None
+
+
 @app.route('/')
 def index():
     """메인 페이지"""
-    cleanup_old_files()
-    return render_template('index.html')
+    global _index_html
+    if _index_html is None:
+        _index_html = render_template('index.html').encode('utf-8')
+    return Response(_index_html, mimetype='text/html')
 
 
 @app.route('/api/convert', methods=['POST'])
@@ -76,27 +253,31 @@ def convert():
         # 고유 ID 생성
         file_id = str(uuid.uuid4())
         
-        # 파일 저장
+        # 업로드 스트림을 디스크에 따로 저장하지 않고 바로 변환
         original_filename = secure_filename(file.filename)
-        msg_path = UPLOAD_FOLDER / f"{file_id}_{original_filename}"
-        file.save(str(msg_path))
-        
-        # 변환
         converter = MSGtoEMLConverter(verbose=False)
         eml_filename = original_filename.rsplit('.', 1)[0] + '.eml'
         eml_path = CONVERTED_FOLDER / f"{file_id}_{eml_filename}"
         
-        converter.convert_file(str(msg_path), str(eml_path))
+        msg_stream = file.stream
+        if not msg_stream.seekable():
+            # OLE 파싱에는 임의 접근이 필요하므로 탐색 가능한 버퍼로 복사
+            msg_stream = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+            shutil.copyfileobj(file.stream, msg_stream)
+            msg_stream.seek(0)
         
-        # 원본 삭제
-        msg_path.unlink()
+        try:
+            converter.convert_stream(msg_stream, str(eml_path), original_filename)
+        finally:
+            if msg_stream is not file.stream:
+                msg_stream.close()
         
         # 세션에 저장
-        conversion_sessions[file_id] = {
+        conversion_sessions.set(file_id, {
             'original_name': original_filename,
             'eml_name': eml_filename,
             'eml_path': str(eml_path)
-        }
+        })
         
         return jsonify({
             'success': True,
@@ -112,10 +293,10 @@ def convert():
 @app.route('/api/download/<file_id>')
 def download(file_id):
     """변환된 EML 파일 다운로드"""
-    if file_id not in conversion_sessions:
+    session = conversion_sessions.get(file_id)
+    if session is None:
         return jsonify({'success': False, 'error': '파일을 찾을 수 없습니다'}), 404
     
-    session = conversion_sessions[file_id]
     eml_path = Path(session['eml_path'])
     
     if not eml_path.exists():
@@ -129,6 +310,129 @@ def download(file_id):
     )
 
 
+class _ZipStream:
+    """ZipFile 출력을 받아 두었다가 청크 단위로 꺼내주는 쓰기 전용 스트림"""
+    
+    def __init__(self):
+        self._chunks = []
+        self.size = 0
+    
+    def write(self, data) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+            self.size += len(data)
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def drain(self) -> bytes:
+        """지금까지 쌓인 데이터를 반환하고 버퍼를 비움"""
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self.size = 0
+        return data
+
+
+def _compress_entry(eml_path: str, arcname: str):
+    """
+    ZIP 항목 하나를 미리 압축 (작업 스레드에서 실행)
+    
+    Returns:
+        (ZipInfo, 압축된 데이터) / 큰 파일이면 (ZipInfo, None)
+    """
+    zinfo = zipfile.ZipInfo.from_file(eml_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    
+    if zinfo.file_size > ZIP_PRECOMPRESS_LIMIT:
+        return zinfo, None
+    
+    with open(eml_path, 'rb') as f:
+        data = f.read()
+    
+    if len(data) < ZIP_STORE_LIMIT:
+        zinfo.compress_type = zipfile.ZIP_STORED
+        blob = data
+    else:
+        deflate = isal_zlib if isal_zlib is not None else zlib
+        compressor = deflate.compressobj(ZIP_COMPRESS_LEVEL, deflate.DEFLATED, -15)
+        blob = compressor.compress(data) + compressor.flush()
+    
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(blob)
+    zinfo.CRC = zlib.crc32(data)
+    return zinfo, blob
+
+
+def _write_compressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, blob: bytes):
+    """
+    미리 압축된 데이터를 ZIP 항목으로 기록
+    
+    ZipFile에는 압축된 데이터를 그대로 쓰는 공개 API가 없으므로
+    _ZipWriteFile.close()와 같은 순서로 헤더/데이터/목록을 갱신함
+    (CRC와 크기를 미리 알기 때문에 데이터 디스크립터는 필요 없음)
+    
+    CPython 3.11 Lib/zipfile.py의 ZipFile._open_to_write()와
+    _ZipWriteFile.close()를 따라 작성 (ZipFile 내부 속성 사용,
+    tests/test_app.py의 download-all 테스트로 확인)
+    항목 크기는 ZIP_PRECOMPRESS_LIMIT 이하이므로 ZIP64 헤더는 쓰지 않음
+    """
+    if zipf._writing:
+        raise ValueError("다른 ZIP 항목을 쓰는 중입니다")
+    zinfo.flag_bits = 0x00
+    if not zinfo.external_attr:
+        zinfo.external_attr = 0o600 << 16
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    
+    zipf.fp.write(zinfo.FileHeader())
+    zipf.fp.write(blob)
+    
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _iter_zip(entries):
+    """(파일 경로, ZIP 내 이름) 목록을 ZIP으로 압축하면서 바로 내보냄"""
+    stream = _ZipStream()
+    
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED,
+                         compresslevel=ZIP_COMPRESS_LEVEL) as zipf, \
+            ThreadPoolExecutor(max_workers=ZIP_WORKERS) as executor:
+        # 순서를 유지하면서 최대 ZIP_WORKERS * 2개까지만 미리 압축
+        # (클라이언트가 느려도 메모리에 쌓이는 양을 제한)
+        pending = deque()
+        entries = iter(entries)
+        
+        while True:
+            while len(pending) < ZIP_WORKERS * 2:
+                entry = next(entries, None)
+                if entry is None:
+                    break
+                pending.append((entry, executor.submit(_compress_entry, *entry)))
+            
+            if not pending:
+                break
+            
+            (eml_path, arcname), future = pending.popleft()
+            zinfo, blob = future.result()
+            if blob is None:
+                # 큰 파일은 표준 zlib로 ZipFile이 직접 압축
+                zipf.write(eml_path, arcname)
+            else:
+                _write_compressed(zipf, zinfo, blob)
+            
+            if stream.size >= ZIP_CHUNK_SIZE:
+                yield stream.drain()
+    
+    # 남은 데이터 + 중앙 디렉토리 레코드
+    data = stream.drain()
+    if data:
+        yield data
+
+
 @app.route('/api/download-all', methods=['POST'])
 def download_all():
     """여러 파일을 ZIP으로 다운로드"""
@@ -138,28 +442,20 @@ def download_all():
     if not file_ids:
         return jsonify({'success': False, 'error': '파일이 없습니다'}), 400
     
-    try:
-        # ZIP 파일 생성
-        zip_id = str(uuid.uuid4())
-        zip_path = CONVERTED_FOLDER / f"{zip_id}_converted_emails.zip"
-        
-        with zipfile.ZipFile(str(zip_path), 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_id in file_ids:
-                if file_id in conversion_sessions:
-                    session = conversion_sessions[file_id]
-                    eml_path = Path(session['eml_path'])
-                    if eml_path.exists():
-                        zipf.write(str(eml_path), session['eml_name'])
-        
-        return send_file(
-            str(zip_path),
-            as_attachment=True,
-            download_name='converted_emails.zip',
-            mimetype='application/zip'
-        )
-        
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    # 응답을 시작하기 전에 대상 파일 목록 확정
+    entries = []
+    for file_id in file_ids:
+        session = conversion_sessions.get(file_id)
+        if session is not None:
+            eml_path = Path(session['eml_path'])
+            if eml_path.exists():
+                entries.append((str(eml_path), session['eml_name']))
+    
+    return Response(
+        _iter_zip(entries),
+        mimetype='application/zip',
+        headers={'Content-Disposition': 'attachment; filename=converted_emails.zip'}
+    )
 
 
 @app.route('/api/clear', methods=['POST'])
@@ -169,13 +465,12 @@ def clear_session():
     file_ids = data.get('file_ids', [])
     
     for file_id in file_ids:
-        if file_id in conversion_sessions:
-            session = conversion_sessions[file_id]
+        session = conversion_sessions.pop(file_id)
+        if session is not None:
             try:
                 Path(session['eml_path']).unlink(missing_ok=True)
             except:
                 pass
-            del conversion_sessions[file_id]
     
     return jsonify({'success': True})
 
@@ -185,4 +480,4 @@ if __name__ == '__main__':
     print("  MSG to EML Converter")
     print("  http://localhost:5001 에서 접속하세요")
     print("="*50 + "\n")
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    create_app().run(debug=True, host='0.0.0.0', port=5001, threaded=True)
@@ -0,0 +1,1299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Email Format Converter - Desktop GUI Application
+다양한 이메일 형식 변환을 지원하는 CustomTkinter 기반 데스크톱 앱
+
+지원 변환:
+- MSG → EML
+- EML → MSG
+- EML → PST (Windows + Outlook 필요)
+
+실행: python gui_app.py (작업 프로세스가 GUI를 import하지 않도록 진입점은 gui_app.py에 분리)
+"""
+
+import os
+import sys
+import threading
+import atexit
+import logging
+import logging.handlers
+import queue
+import multiprocessing
+import platform
+import subprocess
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from datetime import datetime
+from pathlib import Path
+import tkinter as tk
+from tkinter import filedialog
+import customtkinter as ctk
+
+# 실행 중 바뀌지 않으므로 한 번만 조회
+SYSTEM = platform.system()
+
+# 로그 설정
+def setup_logging():
+    """로그 설정"""
+    if getattr(sys, 'frozen', False):
+        log_dir = Path(sys.executable).parent
+    else:
+        log_dir = Path(__file__).parent
+    
+    log_file = log_dir / "converter.log"
+    # EMAIL_CONV_VERBOSE가 설정된 경우에만 시작 배너와 DEBUG 로그 기록
+    verbose = bool(os.environ.get("EMAIL_CONV_VERBOSE"))
+    log_format = "%(asctime)s [%(levelname)s] %(message)s"
+    
+    # 로그 기록(파일/콘솔)은 QueueListener 스레드에서 처리해 UI 스레드가 디스크 I/O를 기다리지 않게 함
+    # (파일은 delay=True로 첫 기록 시점에 열림)
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.FileHandler(log_file, encoding='utf-8', mode='a', delay=True),
+        logging.StreamHandler(sys.stdout)
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format=log_format,
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    
+    logger = logging.getLogger(__name__)
+    if verbose:
+        logger.info("=" * 60)
+        logger.info("Email Format Converter 시작 - %s", datetime.now())
+        logger.info("Python 버전: %s", sys.version)
+        logger.info("OS: %s", SYSTEM)
+        logger.info("=" * 60)
+    
+    return logger
+
+# 로그 설정은 main()에서 (import만 해서는 핸들러/리스너 스레드를 만들지 않음)
+logger = logging.getLogger(__name__)
+
+# 개별 파일 변환 동시 작업 수
+CONVERT_WORKERS = min(8, os.cpu_count() or 4)
+
+# 창을 닫을 때 변환 중인 작업 프로세스가 끝나기를 기다리는 최대 시간(초)
+PROCESS_SHUTDOWN_TIMEOUT = 1.0
+
+# MSG 파싱은 CPU 위주라 작업 프로세스에서 변환
+# (macOS PyInstaller 빌드에서는 spawn 방식 작업 프로세스가 불안정하므로 스레드로만 변환)
+USE_PROCESS_POOL = not (SYSTEM == "Darwin" and getattr(sys, "frozen", False))
+
+
+def _reveal_file(path: str):
+    """파일 탐색기에서 파일 위치 열기 (프로세스 종료를 기다리지 않음)"""
+    try:
+        if SYSTEM == "Windows":
+            subprocess.Popen(["explorer", f"/select,{os.path.normpath(path)}"])
+        elif SYSTEM == "Darwin":
+            subprocess.Popen(["open", "-R", path])
+        else:
+            subprocess.Popen(["xdg-open", os.path.dirname(path) or "."])
+    except OSError:
+        logger.exception("파일 위치 열기 실패: %s", path)
+
+
+class _DaemonPool:
+    """
+    데몬 스레드로 작업을 실행하는 스레드 풀
+    
+    ThreadPoolExecutor의 작업 스레드는 인터프리터 종료 시 join되므로,
+    변환 중에 창을 닫아도 프로세스가 바로 끝나도록 데몬 스레드를 사용
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self.jobs = queue.Queue()
+        self._shutdown = False
+        for i in range(max_workers):
+            threading.Thread(target=self._run, name=f"{thread_name_prefix}_{i}", daemon=True).start()
+    
+    def submit(self, func, *args, **kwargs) -> Future:
+        """func(*args, **kwargs)를 작업 스레드에서 실행하도록 예약"""
+        if self._shutdown:
+            raise RuntimeError("종료된 풀에는 작업을 추가할 수 없습니다")
+        future = Future()
+        self.jobs.put((func, args, kwargs, future))
+        return future
+    
+    def shutdown(self, wait: bool = False, cancel_futures: bool = False):
+        """새 작업을 받지 않고 작업 스레드 종료 (데몬 스레드이므로 기다리지 않음)"""
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    _, _, _, future = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                future.cancel()
+        self.jobs.put(None)
+    
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self.jobs.put(None)  # 다른 작업 스레드도 종료
+                return
+            func, args, kwargs, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+
+def _format_size(size) -> str:
+    """파일 크기 표시 문자열 (크기를 모르면 빈 문자열)"""
+    if size is None:
+        return ""
+    if size < 1024:
+        return f"{size} B"
+    # 단위는 비트 길이로 바로 구하고 나눗셈은 한 번만
+    idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
+
+# 변환기는 처음 쓸 때 import (시작 시간 단축)
+# importlib 대신 import 문을 그대로 두어 PyInstaller가 모듈을 찾을 수 있게 함
+_converter_cache = {}
+
+
+def _import_converter(key: str):
+    """변환기 모듈 import -> (변환기 클래스, check_outlook_available)"""
+    if key == "msg_to_eml":
+        from converters.msg_to_eml import MSGtoEMLConverter
+        return MSGtoEMLConverter, None
+    if key == "eml_to_msg":
+        from converters.eml_to_msg import EMLtoMSGConverter, check_outlook_available
+        return EMLtoMSGConverter, check_outlook_available
+    if key == "eml_to_pst":
+        from converters.eml_to_pst import EMLtoPSTConverter, check_outlook_available
+        return EMLtoPSTConverter, check_outlook_available
+    raise KeyError(key)
+
+
+def _lazy_load(key: str):
+    """변환기 클래스/Outlook 확인 함수 로드 (실패 시 (None, None))"""
+    if key not in _converter_cache:
+        try:
+            _converter_cache[key] = _import_converter(key)
+            logger.debug("%s 로드 성공", _converter_cache[key][0].__name__)
+        except Exception as e:
+            logger.error("%s 변환기 로드 실패: %s", key, e)
+            _converter_cache[key] = (None, None)
+    return _converter_cache[key]
+
+
+# Outlook 연결에 성공한 변환기 키 (실패는 Outlook을 나중에 실행할 수 있으므로 캐시하지 않음)
+_outlook_ok = set()
+
+
+def _check_outlook(key: str) -> tuple:
+    """해당 변환기의 Outlook 사용 가능 여부 확인 (성공한 결과만 캐시)"""
+    if key in _outlook_ok:
+        return True, None
+    _, check = _lazy_load(key)
+    if check is None:
+        return False, "모듈 로드 실패"
+    available, error = check()
+    if available:
+        _outlook_ok.add(key)
+    return available, error
+
+
+class ConverterTab(ctk.CTkFrame):
+    """변환기 탭의 기본 클래스 (변환 방향별 값은 하위 클래스에서 지정)"""
+    
+    SOURCE_EXT = ""      # 입력 확장자 (소문자)
+    TARGET_EXT = ""      # 출력 확장자 (소문자)
+    SOURCE_LABEL = ""    # 화면 표시용 (대문자)
+    TARGET_LABEL = ""
+    SOURCE_SUFFIX = ""   # '.msg' 등
+    TARGET_SUFFIX = ""
+    CONVERTER_KEY = ""   # _lazy_load 키
+    COMBINE_OUTPUT = False  # PST처럼 여러 파일을 하나로 합치는 경우
+    
+    STATUS_ICONS = {
+        "pending": ("⏳", "gray"),
+        "converting": ("🔄", "#f59e0b"),
+        "success": ("✅", "#10b981"),
+        "error": ("❌", "#ef4444")
+    }
+    
+    # 파일 목록 (Canvas 가상 리스트) - 보이는 행만 그림
+    ROW_HEIGHT = 40
+    REMOVE_WIDTH = 35
+    SIZE_WIDTH = 70
+    FLUSH_INTERVAL_MS = 50  # 변환 중 UI 갱신 간격 (약 20Hz)
+    MAX_ROW_SLOTS = 1024  # 재사용 슬롯 상한 (파일 수와 무관하게 Canvas 아이템 수 제한)
+    LIST_BG = "#2b2b2b"
+    ROW_BG = "#333333"
+    TEXT_COLOR = "#dce4ee"
+    
+    def __init__(self, parent, app):
+        super().__init__(parent, fg_color="transparent")
+        
+        self.app = app
+        
+        self.files = []  # [(path, name, size_text, status, output_path), ...]
+        self._file_set = set()  # 중복 검사용
+        self._top_index = 0  # 목록 맨 위에 보이는 행
+        self._row_pool = []  # 화면 행 슬롯별 Canvas 아이템 (bg, icon, name, mask, size, remove_text)
+        self._row_width = None  # 슬롯 배치에 사용한 Canvas 폭
+        self._slot_drawn = []  # 슬롯별로 마지막에 그린 (이름, 크기 문자열, 상태), 숨김이면 None
+        self._empty_item = None  # 빈 목록 안내 문구 아이템
+        self.output_folder = None
+        
+        # 변환 중 UI 갱신 묶음 처리용
+        self._dirty_lock = threading.Lock()
+        self._dirty_rows = {}  # list_index -> status
+        self._dirty_progress = None  # (상태 문구, 진행률)
+        self._flush_scheduled = False
+        
+        # 변환기 인스턴스 (첫 변환 시 생성)
+        self.converter = None
+        self._warmed = False
+        self._scanning = False
+        self._scan_hides_progress = False
+        
+        self._create_ui()
+    
+    def _create_ui(self):
+        """UI 생성"""
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+        
+        # ===== 버튼 영역 =====
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
+        
+        self.select_files_btn = ctk.CTkButton(
+            button_frame,
+            text=f"📁 {self.SOURCE_LABEL} 파일 선택",
+            font=self.app.F_HEADER,
+            height=40,
+            command=self._select_files
+        )
+        self.select_files_btn.pack(side="left", padx=(0, 8))
+        
+        self.select_folder_btn = ctk.CTkButton(
+            button_frame,
+            text="📂 폴더 선택",
+            font=self.app.F_HEADER,
+            height=40,
+            fg_color="#2d5a27",
+            hover_color="#3d7a37",
+            command=self._select_folder
+        )
+        self.select_folder_btn.pack(side="left", padx=(0, 8))
+        
+        self.clear_btn = ctk.CTkButton(
+            button_frame,
+            text="🗑️",
+            font=self.app.F_LABEL,
+            height=40,
+            width=40,
+            fg_color="#555555",
+            hover_color="#666666",
+            command=self._clear_files
+        )
+        self.clear_btn.pack(side="right")
+        
+        # ===== 파일 목록 =====
+        list_frame = ctk.CTkFrame(self)
+        list_frame.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid_rowconfigure(1, weight=1)
+        
+        list_header = ctk.CTkFrame(list_frame, fg_color="transparent")
+        list_header.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="ew")
+        
+        # 자주 바뀌는 문구는 StringVar로 연결해 configure 없이 갱신
+        self._count_var = tk.StringVar(self, value=f"{self.SOURCE_LABEL} 파일 목록 (0개)")
+        self.file_count_label = ctk.CTkLabel(
+            list_header,
+            textvariable=self._count_var,
+            font=self.app.F_HEADER
+        )
+        self.file_count_label.pack(side="left")
+        
+        list_body = ctk.CTkFrame(list_frame, fg_color="transparent")
+        list_body.grid(row=1, column=0, padx=10, pady=(5, 15), sticky="nsew")
+        list_body.grid_columnconfigure(0, weight=1)
+        list_body.grid_rowconfigure(0, weight=1)
+        
+        self.file_canvas = tk.Canvas(
+            list_body, height=200, bg=self.LIST_BG,
+            highlightthickness=0, bd=0
+        )
+        self.file_canvas.grid(row=0, column=0, sticky="nsew")
+        
+        self.file_scrollbar = ctk.CTkScrollbar(list_body, command=self._on_list_scroll)
+        self.file_scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        self.file_canvas.bind("<Configure>", lambda e: self._redraw())
+        self.file_canvas.bind("<Button-1>", self._on_list_click)
+        self.file_canvas.bind("<Double-Button-1>", self._on_list_double_click)
+        self.file_canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.file_canvas.bind("<Button-4>", self._on_mouse_wheel)
+        self.file_canvas.bind("<Button-5>", self._on_mouse_wheel)
+        
+        # ===== 출력 설정 =====
+        output_frame = ctk.CTkFrame(self, fg_color="transparent")
+        output_frame.grid(row=2, column=0, padx=20, pady=5, sticky="ew")
+        output_frame.grid_columnconfigure(1, weight=1)
+        
+        if self.COMBINE_OUTPUT:
+            output_label = ctk.CTkLabel(
+                output_frame,
+                text=f"출력 {self.TARGET_LABEL} 파일:",
+                font=self.app.F_BODY
+            )
+        else:
+            output_label = ctk.CTkLabel(
+                output_frame,
+                text="출력 폴더:",
+                font=self.app.F_BODY
+            )
+        output_label.grid(row=0, column=0, padx=(0, 8))
+        
+        default_text = "지정하려면 클릭" if self.COMBINE_OUTPUT else "원본 파일과 같은 위치"
+        self.output_path_var = ctk.StringVar(value=default_text)
+        output_entry = ctk.CTkEntry(
+            output_frame,
+            textvariable=self.output_path_var,
+            font=self.app.F_SMALL,
+            state="readonly"
+        )
+        output_entry.grid(row=0, column=1, sticky="ew", padx=(0, 8))
+        
+        output_btn = ctk.CTkButton(
+            output_frame,
+            text="변경",
+            width=50,
+            height=28,
+            command=self._select_output
+        )
+        output_btn.grid(row=0, column=2)
+        
+        # ===== 변환 버튼 =====
+        self.convert_btn = ctk.CTkButton(
+            self,
+            text=f"🔄 {self.TARGET_LABEL}로 변환",
+            font=self.app.F_LARGE,
+            height=45,
+            command=self._start_conversion
+        )
+        self.convert_btn.grid(row=3, column=0, padx=20, pady=(10, 5), sticky="ew")
+        
+        # ===== 진행률 =====
+        self.progress_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.progress_frame.grid(row=4, column=0, padx=20, pady=(5, 15), sticky="ew")
+        
+        self.progress_bar = ctk.CTkProgressBar(self.progress_frame)
+        self.progress_bar.pack(fill="x", pady=(0, 3))
+        self.progress_bar.set(0)
+        
+        self._status_var = tk.StringVar(self, value="대기 중...")
+        self.status_label = ctk.CTkLabel(
+            self.progress_frame,
+            textvariable=self._status_var,
+            font=self.app.F_SMALL,
+            text_color="gray"
+        )
+        self.status_label.pack()
+        self.progress_frame.grid_remove()
+    
+    def _select_files(self):
+        """파일 선택"""
+        logger.info("파일 선택 다이얼로그 (%s)", self.SOURCE_EXT)
+        
+        filetypes = [(f"{self.SOURCE_LABEL} 파일", f"*.{self.SOURCE_EXT}")]
+        files = filedialog.askopenfilenames(
+            title=f"{self.SOURCE_LABEL} 파일 선택",
+            filetypes=filetypes
+        )
+        
+        # 취소했거나 이미 목록에 있는 파일뿐이면 아무것도 하지 않음
+        files = [f for f in files
+                 if f.lower().endswith(self.SOURCE_SUFFIX) and f not in self._file_set]
+        if files:
+            # 파일 크기 확인(stat)은 백그라운드에서 수행
+            self.app.io_executor.submit(self._stat_files_bg, files)
+    
+    def _stat_files_bg(self, files):
+        """선택한 파일 크기 확인 및 표시 문자열 생성 (백그라운드)"""
+        entries = []
+        for f in files:
+            try:
+                size = os.stat(f).st_size
+            except OSError:
+                size = None
+            entries.append((f, _format_size(size)))
+        self.app._schedule_update(partial(self._apply_scanned_files, entries, notify_empty=False))
+    
+    def _select_folder(self):
+        """폴더 선택"""
+        logger.info("폴더 선택 다이얼로그 (%s)", self.SOURCE_EXT)
+        
+        folder = filedialog.askdirectory(title=f"{self.SOURCE_LABEL} 파일이 있는 폴더 선택")
+        
+        if folder:
+            # 네트워크 폴더 등에서 UI가 멈추지 않도록 스캔은 백그라운드에서 수행
+            self.select_files_btn.configure(state="disabled")
+            self.select_folder_btn.configure(state="disabled")
+            self._count_var.set("폴더 스캔 중...")
+            self._start_scan_spinner()
+            self.app.io_executor.submit(self._scan_folder_bg, folder)
+    
+    def _start_scan_spinner(self):
+        """폴더 스캔 중 진행 막대를 반복 애니메이션으로 표시"""
+        self._scan_hides_progress = not self.progress_frame.winfo_manager()
+        self.convert_btn.configure(state="disabled")
+        self.progress_frame.grid()
+        self.progress_bar.configure(mode="indeterminate")
+        self.progress_bar.start()
+        self._status_var.set("폴더 스캔 중...")
+        self._scanning = True
+    
+    def _stop_scan_spinner(self):
+        """스캔 애니메이션 중지 (스캔 전에 숨겨져 있었으면 다시 숨김)"""
+        if not self._scanning:
+            return
+        self._scanning = False
+        self.convert_btn.configure(state="normal")
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode="determinate")
+        self.progress_bar.set(0)
+        self._status_var.set("대기 중...")
+        if self._scan_hides_progress:
+            self.progress_frame.grid_remove()
+    
+    def _scan_folder_bg(self, folder: str):
+        """폴더 스캔 (백그라운드)"""
+        try:
+            # 한 번의 scandir로 확장자 대소문자 구분 없이 수집
+            ext = self.SOURCE_SUFFIX
+            with os.scandir(folder) as it:
+                files = [(entry.path, _format_size(entry.stat().st_size)) for entry in it
+                         if entry.is_file() and entry.name.lower().endswith(ext)]
+            error = None
+        except OSError as e:
+            logger.error("폴더 스캔 실패 %s: %s", folder, e)
+            files, error = [], str(e)
+        
+        self.app._schedule_update(partial(self._apply_scanned_files, files, error))
+    
+    def _apply_scanned_files(self, files, error: str = None, notify_empty: bool = True):
+        """스캔 결과 [(경로, 크기 문자열), ...]를 목록에 반영 (UI 스레드)"""
+        self._stop_scan_spinner()
+        self.select_files_btn.configure(state="normal")
+        self.select_folder_btn.configure(state="normal")
+        
+        added = sum(self._add_file(f, size_text) for f, size_text in files)
+        if added:
+            self._update_file_list()
+            self._warm_up()
+        else:
+            # 새로 추가된 파일이 없으면 목록은 다시 그리지 않음
+            self._update_count_label()
+        
+        if error:
+            self._show_message("오류", f"폴더를 읽을 수 없습니다.\n{error}")
+        elif not files and notify_empty:
+            self._show_message("알림", f"{self.SOURCE_LABEL} 파일이 없습니다.")
+    
+    def _select_output(self):
+        """출력 경로 선택"""
+        if self.COMBINE_OUTPUT:
+            # PST: 출력 폴더 선택 (파일명은 자동 생성)
+            folder = filedialog.askdirectory(title=f"출력 {self.TARGET_LABEL} 파일을 저장할 폴더 선택")
+            if folder:
+                self.output_folder = folder
+                self.output_path_var.set(folder)
+            else:
+                self.output_folder = None
+                self.output_path_var.set("지정하려면 클릭")
+        else:
+            folder = filedialog.askdirectory(title="출력 폴더 선택")
+            if folder:
+                self.output_folder = folder
+                self.output_path_var.set(folder)
+            else:
+                self.output_folder = None
+                self.output_path_var.set("원본 파일과 같은 위치")
+    
+    def _add_file(self, file_path: str, size_text: str = "") -> bool:
+        """파일 추가 (size_text는 미리 만들어 둔 크기 표시 문자열), 이미 있으면 False"""
+        if file_path in self._file_set:
+            return False
+        self._file_set.add(file_path)
+        self.files.append((file_path, os.path.basename(file_path), size_text, "pending", None))
+        return True
+    
+    def _set_file_status(self, list_index: int, status: str, output=None):
+        """파일의 상태/결과만 변경 (경로·이름·크기는 유지)"""
+        file_path, name, size_text, _, _ = self.files[list_index]
+        self.files[list_index] = (file_path, name, size_text, status, output)
+    
+    def _clear_files(self):
+        """파일 목록 초기화"""
+        self.files = []
+        self._file_set.clear()
+        self._update_file_list()
+    
+    def _update_file_list(self):
+        """파일 목록 UI 업데이트"""
+        self._update_count_label()
+        self._redraw()
+    
+    def _update_count_label(self):
+        """파일 개수 표시 갱신"""
+        self._count_var.set(f"{self.SOURCE_LABEL} 파일 목록 ({len(self.files)}개)")
+    
+    def _visible_count(self) -> int:
+        """화면에 들어가는 행 수"""
+        return max(1, self.file_canvas.winfo_height() // self.ROW_HEIGHT)
+    
+    def _redraw(self):
+        """보이는 범위의 행만 다시 그림 (Canvas 아이템은 재사용)"""
+        canvas = self.file_canvas
+        width = canvas.winfo_width()
+        total = len(self.files)
+        
+        if not total:
+            self._top_index = 0
+            self._hide_rows(0)
+            if self._empty_item is None:
+                self._empty_item = canvas.create_text(
+                    0, 80,
+                    text=f"📭 {self.SOURCE_LABEL} 파일을 선택하세요\n\n파일 또는 폴더를 선택하면 여기에 표시됩니다",
+                    font=self.app.F_BODY, fill="gray", justify="center"
+                )
+            canvas.coords(self._empty_item, width // 2, 80)
+            canvas.itemconfigure(self._empty_item, state="normal")
+            self.file_scrollbar.set(0, 1)
+            return
+        
+        if self._empty_item is not None:
+            canvas.itemconfigure(self._empty_item, state="hidden")
+        
+        visible = self._visible_count()
+        self._top_index = max(0, min(self._top_index, total - visible))
+        count = min(total - self._top_index, visible + 1, self.MAX_ROW_SLOTS)
+        self._trim_pool(visible + 1)
+        if width != self._row_width:
+            self._row_width = width
+            for slot, items in enumerate(self._row_pool):
+                self._layout_row(slot, items, width)
+        while len(self._row_pool) < count:
+            self._row_pool.append(self._create_row_items(len(self._row_pool), width))
+            self._slot_drawn.append(None)
+        
+        for slot in range(count):
+            self._draw_row(slot, self._top_index + slot)
+        self._hide_rows(count)
+        
+        self.file_scrollbar.set(self._top_index / total, min(1.0, (self._top_index + visible) / total))
+    
+    def _trim_pool(self, size: int):
+        """창이 줄어 화면에 들어가는 행보다 많아진 슬롯 삭제"""
+        size = min(size, self.MAX_ROW_SLOTS)
+        while len(self._row_pool) > size:
+            slot = len(self._row_pool) - 1
+            self.file_canvas.delete(f"slot{slot}")
+            self._row_pool.pop()
+            self._slot_drawn.pop()
+    
+    def _create_row_items(self, slot: int, width: int) -> tuple:
+        """행 슬롯 하나의 Canvas 아이템 생성 -> (bg, icon, name, mask, size, remove_text)
+        
+        슬롯의 모든 아이템은 slot{n}, ✕ 영역은 rm{n} 태그로 묶어
+        표시/숨김을 태그 단위 한 번의 호출로 처리
+        """
+        canvas = self.file_canvas
+        row_tags = (f"slot{slot}",)
+        remove_tags = (f"slot{slot}", f"rm{slot}")
+        items = (
+            canvas.create_rectangle(0, 0, 0, 0, fill=self.ROW_BG, outline="", tags=row_tags),
+            canvas.create_text(0, 0, font=self.app.F_ICON, fill=self.TEXT_COLOR, tags=row_tags),
+            canvas.create_text(0, 0, anchor="w", font=self.app.F_BODY, fill=self.TEXT_COLOR, tags=row_tags),
+            # 긴 파일명 위에 덮어 그려 크기·✕ 영역 확보
+            canvas.create_rectangle(0, 0, 0, 0, fill=self.ROW_BG, outline="", tags=row_tags),
+            canvas.create_text(0, 0, anchor="e", font=self.app.F_SMALL, fill="gray", tags=row_tags),
+            canvas.create_text(0, 0, text="✕", font=self.app.F_BODY, fill=self.TEXT_COLOR, tags=remove_tags),
+        )
+        self._layout_row(slot, items, width)
+        return items
+    
+    def _layout_row(self, slot: int, items: tuple, width: int):
+        """슬롯 아이템 위치 지정 (슬롯 위치는 고정이라 폭이 바뀔 때만 호출)"""
+        canvas = self.file_canvas
+        bg, icon_item, name_item, mask, size_item, remove_text = items
+        y = slot * self.ROW_HEIGHT
+        mid = y + self.ROW_HEIGHT // 2
+        
+        canvas.coords(bg, 3, y + 2, width - 3, y + self.ROW_HEIGHT - 2)
+        canvas.coords(icon_item, 20, mid)
+        canvas.coords(name_item, 40, mid)
+        size_right = width - self.REMOVE_WIDTH - 4
+        canvas.coords(mask, size_right - self.SIZE_WIDTH, y + 2, width - 3, y + self.ROW_HEIGHT - 2)
+        canvas.coords(size_item, size_right, mid)
+        canvas.coords(remove_text, width - 20, mid)
+    
+    def _draw_row(self, slot: int, index: int):
+        """슬롯에 파일 한 행 표시"""
+        canvas = self.file_canvas
+        _, icon_item, name_item, _, size_item, _ = self._row_pool[slot]
+        _, name, size_text, status, _ = self.files[index]
+        
+        # 이전에 그린 내용과 같으면 Tk 호출 생략
+        drawn = self._slot_drawn[slot]
+        if drawn == (name, size_text, status):
+            return
+        
+        icon, _ = self.STATUS_ICONS.get(status, self.STATUS_ICONS["pending"])
+        canvas.itemconfigure(icon_item, text=icon)
+        if drawn is None or drawn[:2] != (name, size_text):
+            canvas.itemconfigure(name_item, text=name)
+            canvas.itemconfigure(size_item, text=size_text)
+        canvas.itemconfigure(f"slot{slot}", state="normal")
+        if status != "pending":
+            canvas.itemconfigure(f"rm{slot}", state="hidden")
+        self._slot_drawn[slot] = (name, size_text, status)
+    
+    def _hide_rows(self, start: int):
+        """start 이후 슬롯 숨김"""
+        for slot in range(start, len(self._row_pool)):
+            if self._slot_drawn[slot] is not None:
+                self.file_canvas.itemconfigure(f"slot{slot}", state="hidden")
+                self._slot_drawn[slot] = None
+    
+    def _set_row_status(self, index: int, status: str):
+        """행 하나의 상태 아이콘만 갱신 (화면 밖이면 다음 redraw에서 반영)"""
+        slot = index - self._top_index
+        if not 0 <= slot < len(self._row_pool) or index >= len(self.files):
+            return
+        drawn = self._slot_drawn[slot]
+        if drawn is None or drawn[2] == status:
+            return
+        icon, _ = self.STATUS_ICONS.get(status, self.STATUS_ICONS["pending"])
+        self.file_canvas.itemconfigure(self._row_pool[slot][1], text=icon)
+        if status != "pending":
+            self.file_canvas.itemconfigure(f"rm{slot}", state="hidden")
+        self._slot_drawn[slot] = (drawn[0], drawn[1], status)
+    
+    def _scroll_to(self, top: int):
+        """맨 위 행 변경"""
+        if top != self._top_index:
+            self._top_index = top
+            self._redraw()
+    
+    def _on_list_scroll(self, action, value, unit=None):
+        """스크롤바 이동"""
+        if action == "moveto":
+            self._scroll_to(int(float(value) * len(self.files)))
+        elif action == "scroll":
+            step = int(value) * (self._visible_count() if unit == "pages" else 1)
+            self._scroll_to(self._top_index + step)
+    
+    def _on_mouse_wheel(self, event):
+        """마우스 휠 스크롤"""
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(max(0, self._top_index - 3))
+        else:
+            self._scroll_to(self._top_index + 3)
+    
+    def _on_list_click(self, event):
+        """✕ 영역 클릭 시 파일 제거"""
+        index = self._top_index + event.y // self.ROW_HEIGHT
+        if index >= len(self.files) or self.files[index][3] != "pending":
+            return
+        if event.x >= self.file_canvas.winfo_width() - self.REMOVE_WIDTH:
+            self._remove_file(index)
+    
+    def _on_list_double_click(self, event):
+        """변환 완료된 행을 더블클릭하면 결과 파일 위치 열기"""
+        index = self._top_index + event.y // self.ROW_HEIGHT
+        if index >= len(self.files):
+            return
+        _, _, _, status, output_path = self.files[index]
+        if status == "success" and output_path:
+            _reveal_file(output_path)
+    
+    def _remove_file(self, index: int):
+        """파일 제거"""
+        if 0 <= index < len(self.files):
+            self._file_set.discard(self.files[index][0])
+            del self.files[index]
+            self._update_file_list()
+    
+    def _get_converter(self):
+        """변환기 인스턴스 반환 (처음 호출 시 모듈 로드 및 생성)"""
+        if self.converter is None:
+            converter_class, _ = _lazy_load(self.CONVERTER_KEY)
+            if converter_class:
+                try:
+                    self.converter = converter_class(verbose=True)
+                    logger.info("%s 인스턴스 생성", converter_class.__name__)
+                except Exception as e:
+                    logger.error("%s 인스턴스 생성 실패: %s", converter_class.__name__, e)
+        return self.converter
+    
+    def _warm_up(self):
+        """파일을 처음 추가했을 때 변환기 모듈을 백그라운드에서 미리 로드 (한 번만)"""
+        if self._warmed:
+            return
+        self._warmed = True
+        self.app.io_executor.submit(self._warm_up_bg)
+    
+    def _warm_up_bg(self):
+        """변환기 모듈 및 의존 라이브러리 로드 (백그라운드)"""
+        converter_class, _ = _lazy_load(self.CONVERTER_KEY)
+        warm_up = getattr(converter_class, "warm_up", None)
+        if warm_up:
+            try:
+                warm_up()
+            except Exception as e:
+                logger.debug("%s 예열 실패: %s", self.CONVERTER_KEY, e)
+    
+    def _start_conversion(self):
+        """변환 시작"""
+        if not self._get_converter():
+            self._show_message("오류", "변환기를 사용할 수 없습니다.")
+            return
+        
+        pending = [(i, f, n) for i, (f, n, _, s, _) in enumerate(self.files) if s == "pending"]
+        
+        if not pending:
+            self._show_message("알림", "변환할 파일이 없습니다.")
+            return
+        
+        # PST 변환 시 출력 파일 필수
+        if self.COMBINE_OUTPUT and not self.output_folder:
+            self._show_message("알림", f"출력 {self.TARGET_LABEL} 파일을 지정하세요.")
+            return
+        
+        self.convert_btn.configure(state="disabled", text="변환 중...")
+        self.select_files_btn.configure(state="disabled")
+        self.select_folder_btn.configure(state="disabled")
+        self.progress_frame.grid()
+        self.progress_bar.set(0)
+        
+        self.app.executor.submit(self._convert_files, pending)
+    
+    def _schedule_row_statuses(self, pending_files, status: str):
+        """여러 행의 상태 갱신을 UI 업데이트 한 번으로 예약"""
+        indices = [list_index for list_index, _, _ in pending_files]
+        
+        def apply():
+            for list_index in indices:
+                self._set_row_status(list_index, status)
+        
+        self.app._schedule_update(apply)
+    
+    def _convert_files(self, pending_files):
+        """변환 실행 (백그라운드)"""
+        success, errors = self._convert_pending(pending_files)
+        self.app._schedule_update(partial(self._conversion_complete, success, errors))
+    
+    def _convert_pending(self, pending_files) -> tuple:
+        """개별 파일 변환 -> (성공 수, 실패 수)"""
+        total = len(pending_files)
+        success = 0
+        errors = 0
+        
+        for list_index, _, _ in pending_files:
+            self._set_file_status(list_index, "converting")
+        self._schedule_row_statuses(pending_files, "converting")
+        
+        # 출력 경로 계산에 쓰는 값은 한 번만 구함
+        out_dir = self.output_folder
+        target_suffix = self.TARGET_SUFFIX
+        
+        # I/O 위주라 스레드 풀로 병렬 처리 (풀은 앱 전체에서 재사용)
+        executor = self.app.convert_pool
+        futures = {
+            executor.submit(self._convert_one, list_index, file_path, name,
+                            out_dir, target_suffix): (list_index, name)
+            for list_index, file_path, name in pending_files
+        }
+        for idx, future in enumerate(as_completed(futures)):
+            list_index, name = futures[future]
+            if future.result():
+                success += 1
+                status = "success"
+            else:
+                errors += 1
+                status = "error"
+            
+            self._mark_dirty(list_index, status, f"변환 중... ({idx+1}/{total}) {name}", (idx + 1) / total)
+        
+        return success, errors
+    
+    def _convert_one(self, list_index: int, file_path: str, name: str,
+                     out_dir: str, target_suffix: str) -> bool:
+        """파일 하나 변환 (워커 스레드)"""
+        try:
+            # 출력 경로는 문자열 연산으로 계산 (out_dir이 없으면 원본과 같은 폴더)
+            stem = os.path.splitext(name)[0]
+            out_name = stem + target_suffix
+            output_path = os.path.join(out_dir or os.path.dirname(file_path), out_name)
+            
+            self._convert_file(file_path, output_path)
+            self._set_file_status(list_index, "success", output_path)
+            return True
+            
+        except Exception as e:
+            # 실패한 파일과 원인은 항상 기록, 스택 트레이스는 상세 로그(EMAIL_CONV_VERBOSE)에서만
+            logger.warning("변환 실패 %s: %s", file_path, e)
+            logger.debug("변환 실패 상세 %s", file_path, exc_info=True)
+            self._set_file_status(list_index, "error", str(e))
+            return False
+    
+    def _convert_file(self, file_path: str, output_path: str):
+        """변환기로 파일 하나 변환 (워커 스레드)"""
+        self.converter.convert_file(file_path, output_path)
+    
+    def _mark_dirty(self, list_index: int, status: str, text: str, progress: float):
+        """변환 결과를 모아 두고 UI 반영은 FLUSH_INTERVAL_MS마다 한 번만 (워커 스레드)"""
+        with self._dirty_lock:
+            self._dirty_rows[list_index] = status
+            self._dirty_progress = (text, progress)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.app._schedule_update(self._schedule_flush)
+    
+    def _schedule_flush(self):
+        """UI 스레드에서 지연 flush 예약"""
+        self.after(self.FLUSH_INTERVAL_MS, self._flush_dirty)
+    
+    def _flush_dirty(self):
+        """모아 둔 행 상태·진행률을 한 번에 반영"""
+        with self._dirty_lock:
+            rows, self._dirty_rows = self._dirty_rows, {}
+            progress, self._dirty_progress = self._dirty_progress, None
+            self._flush_scheduled = False
+        
+        for list_index, status in rows.items():
+            self._set_row_status(list_index, status)
+        if progress is not None:
+            text, fraction = progress
+            self._set_status_text(text)
+            self.progress_bar.set(fraction)
+    
+    def _set_status_text(self, text: str):
+        """진행 상태 문구 변경"""
+        self._status_var.set(text)
+    
+    def _conversion_complete(self, success: int, errors: int):
+        """변환 완료"""
+        self._flush_dirty()  # 아직 반영되지 않은 진행 상황 먼저 처리
+        self.convert_btn.configure(state="normal", text=f"🔄 {self.TARGET_LABEL}로 변환")
+        self.select_files_btn.configure(state="normal")
+        self.select_folder_btn.configure(state="normal")
+        self.progress_bar.set(1)
+        self._status_var.set(f"완료! 성공: {success}, 실패: {errors}")
+        
+        if errors == 0:
+            self._show_message("완료", f"✅ {success}개 파일 변환 완료!")
+        else:
+            self._show_message("완료", f"✅ 성공: {success}개\n❌ 실패: {errors}개")
+    
+    def _show_message(self, title: str, message: str):
+        """메시지 다이얼로그"""
+        self.app.show_message(title, message)
+
+
+class MSGtoEMLTab(ConverterTab):
+    """MSG → EML 탭"""
+    
+    SOURCE_EXT, TARGET_EXT = "msg", "eml"
+    SOURCE_LABEL, TARGET_LABEL = "MSG", "EML"
+    SOURCE_SUFFIX, TARGET_SUFFIX = ".msg", ".eml"
+    CONVERTER_KEY = "msg_to_eml"
+    
+    def _convert_file(self, file_path: str, output_path: str):
+        """작업 프로세스에서 변환 (GIL 없이 병렬 파싱), 사용할 수 없으면 현재 스레드에서 변환"""
+        pool = self.app.get_process_pool()
+        if pool is not None:
+            from converters.msg_to_eml import _convert_one
+            try:
+                pool.submit(_convert_one, file_path, output_path).result()
+                return
+            except BrokenProcessPool as e:
+                logger.warning("작업 프로세스 사용 불가, 스레드로 변환: %s", e)
+                self.app.disable_process_pool()
+        super()._convert_file(file_path, output_path)
+
+
+class EMLtoMSGTab(ConverterTab):
+    """EML → MSG 탭"""
+    
+    SOURCE_EXT, TARGET_EXT = "eml", "msg"
+    SOURCE_LABEL, TARGET_LABEL = "EML", "MSG"
+    SOURCE_SUFFIX, TARGET_SUFFIX = ".eml", ".msg"
+    CONVERTER_KEY = "eml_to_msg"
+
+
+class EMLtoPSTTab(ConverterTab):
+    """EML → PST 탭 (여러 EML을 PST 하나로 합침)"""
+    
+    SOURCE_EXT, TARGET_EXT = "eml", "pst"
+    SOURCE_LABEL, TARGET_LABEL = "EML", "PST"
+    SOURCE_SUFFIX, TARGET_SUFFIX = ".eml", ".pst"
+    CONVERTER_KEY = "eml_to_pst"
+    COMBINE_OUTPUT = True
+    
+    def _convert_pending(self, pending_files) -> tuple:
+        """선택한 파일 전체를 PST 하나로 변환 -> (성공 수, 실패 수)"""
+        total = len(pending_files)
+        success = 0
+        errors = 0
+        
+        # 경로는 변환기가 읽어 가는 대로 하나씩 넘김
+        file_paths = (f for _, f, _ in pending_files)
+        
+        for list_index, _, _ in pending_files:
+            self._set_file_status(list_index, "converting")
+        
+        self._schedule_row_statuses(pending_files, "converting")
+        self.app._schedule_update(partial(self._set_status_text, f"변환 중... {total}개 파일"))
+        
+        try:
+            # 출력 파일 경로 생성 (폴더 + 자동 파일명)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_filename = f"Converted_Emails_{timestamp}.{self.TARGET_EXT}"
+            output_path = str(Path(self.output_folder) / output_filename)
+            
+            result = self.converter.convert_files(file_paths, output_path, total=total)
+            
+            for list_index, _, _ in pending_files:
+                self._set_file_status(list_index, "success", result)
+                success += 1
+            self._schedule_row_statuses(pending_files, "success")
+            
+        except Exception as e:
+            logger.exception("변환 실패: %s", e)
+            
+            for list_index, _, _ in pending_files:
+                self._set_file_status(list_index, "error", str(e))
+                errors += 1
+            self._schedule_row_statuses(pending_files, "error")
+        
+        return success, errors
+
+
+class EmailConverterApp(ctk.CTk):
+    """이메일 형식 변환 앱"""
+    
+    def __init__(self):
+        logger.info("앱 초기화 시작")
+        super().__init__()
+        
+        # 공용 폰트 (위젯마다 새로 만들지 않음)
+        self.F_TITLE = ctk.CTkFont(size=24, weight="bold")
+        self.F_WARN = ctk.CTkFont(size=18, weight="bold")
+        self.F_LARGE = ctk.CTkFont(size=14, weight="bold")
+        self.F_HEADER = ctk.CTkFont(size=13, weight="bold")
+        self.F_ICON = ctk.CTkFont(size=14)
+        self.F_LABEL = ctk.CTkFont(size=13)
+        self.F_BODY = ctk.CTkFont(size=12)
+        self.F_SMALL = ctk.CTkFont(size=11)
+        
+        self.title("Email Format Converter")
+        self.geometry("750x650")
+        self.minsize(650, 550)
+        
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+        
+        self.update_queue = queue.Queue()
+        self._drain_pending = False
+        self._drain_lock = threading.Lock()
+        self.bind("<<QueueUpdate>>", self._drain_queue)
+        # 변환 배치 진행용 상주 스레드 (클릭마다 스레드를 새로 만들지 않음)
+        self.executor = _DaemonPool(max_workers=1, thread_name_prefix="converter")
+        # 폴더 스캔, 파일 크기 확인, 변환기 예열용 (변환 중에도 다른 탭의 스캔이 기다리지 않도록 분리)
+        self.io_executor = _DaemonPool(max_workers=2, thread_name_prefix="scan")
+        # 개별 파일 변환용 풀 (배치마다 새로 만들지 않음)
+        self.convert_pool = _DaemonPool(max_workers=CONVERT_WORKERS, thread_name_prefix="convert")
+        # MSG 변환용 프로세스 풀 (첫 변환 시 생성)
+        self._process_pool = None
+        self._use_processes = USE_PROCESS_POOL
+        self._process_pool_lock = threading.Lock()
+        # 메시지 다이얼로그 (처음 표시할 때 만들고 이후 재사용)
+        self._message_dialog = None
+        self._message_label = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        self._create_ui()
+        
+        logger.info("앱 초기화 완료")
+    
+    def _drain_queue(self, event=None):
+        """대기 중인 UI 업데이트를 한 번에 처리"""
+        with self._drain_lock:
+            self._drain_pending = False
+        # 현재 쌓인 개수만큼만 처리 (이후 추가분은 새 이벤트로 처리됨)
+        for _ in range(self.update_queue.qsize()):
+            try:
+                callback = self.update_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception:
+                logger.exception("큐 처리 오류")
+    
+    def _on_close(self):
+        """창 닫기"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.io_executor.shutdown(wait=False, cancel_futures=True)
+        self.convert_pool.shutdown(wait=False, cancel_futures=True)
+        if self._process_pool is not None:
+            self._shutdown_process_pool(self._process_pool)
+        self.destroy()
+    
+    @staticmethod
+    def _shutdown_process_pool(pool: ProcessPoolExecutor):
+        """
+        프로세스 풀 종료 및 변환 중인 작업 프로세스 강제 종료
+        
+        종료 시 인터프리터가 진행 중인 변환을 기다리지 않도록 함
+        (대기 중인 작업은 취소하고, 정해진 시간 안에 끝나지 않은 작업 프로세스는 종료)
+        """
+        terminate = getattr(pool, "terminate_workers", None)  # Python 3.14+
+        if terminate is not None:
+            terminate()
+            return
+        pool.shutdown(wait=False, cancel_futures=True)
+        # 이 앱에서 multiprocessing 자식 프로세스는 변환 작업 프로세스뿐
+        deadline = time.monotonic() + PROCESS_SHUTDOWN_TIMEOUT
+        for process in multiprocessing.active_children():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+    
+    def get_process_pool(self):
+        """MSG 변환용 프로세스 풀 반환 (처음 호출 시 생성, 사용하지 않으면 None)"""
+        with self._process_pool_lock:
+            if self._process_pool is None and self._use_processes:
+                self._process_pool = ProcessPoolExecutor(max_workers=CONVERT_WORKERS)
+            return self._process_pool
+    
+    def disable_process_pool(self):
+        """작업 프로세스를 띄울 수 없는 환경이면 이후 변환은 스레드로만 처리"""
+        with self._process_pool_lock:
+            self._use_processes = False
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False)
+                self._process_pool = None
+    
+    def show_message(self, title: str, message: str):
+        """메시지 다이얼로그 표시 (위젯은 한 번만 만들고 숨겼다가 다시 표시)"""
+        if self._message_dialog is None:
+            dialog = ctk.CTkToplevel(self)
+            dialog.withdraw()
+            dialog.transient(self)
+            dialog.protocol("WM_DELETE_WINDOW", self._hide_message)
+            
+            self._message_label = ctk.CTkLabel(dialog, font=self.F_LABEL, wraplength=280)
+            self._message_label.pack(expand=True, pady=15)
+            
+            btn = ctk.CTkButton(dialog, text="확인", command=self._hide_message)
+            btn.pack(pady=(0, 15))
+            self._message_dialog = dialog
+        
+        dialog = self._message_dialog
+        dialog.title(title)
+        self._message_label.configure(text=message)
+        # 크기와 위치를 한 번에 지정 (update_idletasks로 앱 전체 레이아웃을 강제하지 않음)
+        x = self.winfo_x() + (self.winfo_width() - 320) // 2
+        y = self.winfo_y() + (self.winfo_height() - 140) // 2
+        dialog.geometry(f"320x140+{x}+{y}")
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+    
+    def _hide_message(self):
+        """메시지 다이얼로그 닫기 (파괴하지 않고 숨김)"""
+        self._message_dialog.grab_release()
+        self._message_dialog.withdraw()
+    
+    def _schedule_update(self, callback):
+        """스레드 안전 UI 업데이트 (이벤트로 Tk 스레드를 깨움)"""
+        self.update_queue.put(callback)
+        with self._drain_lock:
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        try:
+            self.event_generate("<<QueueUpdate>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # 창이 닫히는 중이거나 일시적인 Tcl 오류 - 다음 호출에서 다시 이벤트를 보내도록 표시 해제
+            with self._drain_lock:
+                self._drain_pending = False
+    
+    def _create_ui(self):
+        """UI 생성"""
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+        
+        # 헤더
+        header = ctk.CTkFrame(self, fg_color="transparent")
+        header.grid(row=0, column=0, padx=25, pady=(25, 10), sticky="ew")
+        
+        title = ctk.CTkLabel(
+            header,
+            text="📧 Email Format Converter",
+            font=self.F_TITLE
+        )
+        title.pack(anchor="w")
+        
+        subtitle = ctk.CTkLabel(
+            header,
+            text="MSG, EML, PST 형식 간 변환",
+            font=self.F_LABEL,
+            text_color="gray"
+        )
+        subtitle.pack(anchor="w", pady=(3, 0))
+        
+        # 탭 뷰
+        self._deferred_tabs = {}  # 탭 이름 -> (placeholder, 생성 함수)
+        self.tabview = ctk.CTkTabview(self, height=450, command=self._on_tab_change)
+        self.tabview.grid(row=1, column=0, padx=25, pady=10, sticky="nsew")
+        
+        # 탭 1: MSG → EML
+        tab1 = self.tabview.add("MSG → EML")
+        self.msg_to_eml_tab = MSGtoEMLTab(tab1, self)
+        self.msg_to_eml_tab.pack(fill="both", expand=True)
+        
+        # 탭 2: EML → MSG (Windows + Outlook 필요)
+        tab2 = self.tabview.add("EML → MSG")
+        
+        if SYSTEM == "Windows":
+            self._defer_tab(tab2, "EML → MSG", self._build_eml_to_msg_tab)
+        else:
+            self._show_feature_unavailable(tab2, "EML → MSG", "Windows + Outlook 필요")
+        
+        # 탭 3: EML → PST
+        tab3 = self.tabview.add("EML → PST")
+        
+        # PST 변환 가능 여부는 탭을 처음 열 때 확인
+        if SYSTEM == "Windows":
+            self._defer_tab(tab3, "EML → PST", self._build_eml_to_pst_tab)
+        else:
+            self._show_pst_unavailable(tab3, "Windows + Outlook 필요")
+        
+        # 푸터
+        footer = ctk.CTkLabel(
+            self,
+            text="오프라인에서 작동 • 파일은 저장되지 않음",
+            font=self.F_SMALL,
+            text_color="gray"
+        )
+        footer.grid(row=2, column=0, pady=(5, 15))
+    
+    def _defer_tab(self, tab, name: str, builder):
+        """Outlook 확인이 필요한 탭은 처음 선택될 때 생성"""
+        placeholder = ctk.CTkLabel(tab, text="Outlook 확인 중...", font=self.F_LABEL, text_color="gray")
+        placeholder.pack(pady=80)
+        self._deferred_tabs[name] = (placeholder, partial(builder, tab))
+    
+    def _on_tab_change(self):
+        """탭 선택 시 지연된 탭 생성"""
+        deferred = self._deferred_tabs.pop(self.tabview.get(), None)
+        if deferred:
+            placeholder, build = deferred
+            placeholder.destroy()
+            build()
+    
+    def _build_eml_to_msg_tab(self, tab):
+        """EML → MSG 탭 생성"""
+        available, error = _check_outlook("eml_to_msg")
+        if available:
+            self.eml_to_msg_tab = EMLtoMSGTab(tab, self)
+            self.eml_to_msg_tab.pack(fill="both", expand=True)
+        else:
+            self._show_feature_unavailable(tab, "EML → MSG", f"Outlook 필요: {error}",
+                                           retry=partial(self._build_eml_to_msg_tab, tab))
+    
+    def _build_eml_to_pst_tab(self, tab):
+        """EML → PST 탭 생성"""
+        available, error = _check_outlook("eml_to_pst")
+        if available:
+            self.eml_to_pst_tab = EMLtoPSTTab(tab, self)
+            self.eml_to_pst_tab.pack(fill="both", expand=True)
+        else:
+            self._show_pst_unavailable(tab, f"Outlook 필요: {error}",
+                                       retry=partial(self._build_eml_to_pst_tab, tab))
+    
+    def _show_pst_unavailable(self, parent, message: str, retry=None):
+        """PST 변환 불가 메시지 (하위 호환성)"""
+        self._show_feature_unavailable(parent, "EML → PST", message, retry)
+    
+    def _show_feature_unavailable(self, parent, feature_name: str, message: str, retry=None):
+        """기능 불가 메시지 표시 (retry가 있으면 Outlook 실행 후 다시 확인하는 버튼 추가)"""
+        frame = ctk.CTkFrame(parent, fg_color="transparent")
+        frame.pack(fill="both", expand=True)
+        
+        label = ctk.CTkLabel(
+            frame,
+            text=f"⚠️ {feature_name} 변환 불가",
+            font=self.F_WARN,
+            text_color="#f59e0b"
+        )
+        label.pack(pady=(80, 10))
+        
+        desc = ctk.CTkLabel(
+            frame,
+            text=message,
+            font=self.F_LABEL,
+            text_color="gray"
+        )
+        desc.pack()
+        
+        info = ctk.CTkLabel(
+            frame,
+            text="이 기능은 Windows에서 Microsoft Outlook이\n설치된 환경에서만 사용할 수 있습니다.",
+            font=self.F_BODY,
+            text_color="gray"
+        )
+        info.pack(pady=(20, 0))
+        
+        if retry is not None:
+            def on_retry():
+                frame.destroy()
+                retry()
+            
+            retry_btn = ctk.CTkButton(frame, text="다시 확인", font=self.F_BODY, width=120,
+                                      command=on_retry)
+            retry_btn.pack(pady=(20, 0))
+
+
+def main():
+    setup_logging()
+    logger.info("main() 시작")
+    try:
+        app = EmailConverterApp()
+        logger.info("메인 루프 시작")
+        app.mainloop()
+        logger.info("메인 루프 종료")
+    except Exception as e:
+        logger.exception("앱 실행 오류: %s", e)
+        raise
+
@@ -1,8 +1,19 @@
 # Converters Package
 """이메일 형식 변환 모듈 패키지"""
 
-from .msg_to_eml import MSGtoEMLConverter
-from .eml_to_msg import EMLtoMSGConverter
-from .eml_to_pst import EMLtoPSTConverter
-
 __all__ = ['MSGtoEMLConverter', 'EMLtoMSGConverter', 'EMLtoPSTConverter']
+
+# 하위 모듈은 실제로 접근할 때 import (extract_msg·pywin32 로딩 지연)
+_LAZY_EXPORTS = {
+    'MSGtoEMLConverter': '.msg_to_eml',
+    'EMLtoMSGConverter': '.eml_to_msg',
+    'EMLtoPSTConverter': '.eml_to_pst',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
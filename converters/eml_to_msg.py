@@ -8,18 +8,29 @@ EML to MSG Converter
 요구사항: Windows + Microsoft Outlook 설치
 
 참고: COM 객체는 스레드별로 초기화해야 함
+      → Outlook 호출은 전용 작업 스레드 하나에서만 수행
 """
 
 import os
 import sys
+import base64
+import binascii
 import email
+import queue
+import shutil
 import tempfile
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from email import policy
 from email.parser import BytesParser
+from email.header import Header, decode_header, make_header
+from email.utils import getaddresses
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -30,23 +41,47 @@ OUTLOOK_ERROR = None
 try:
     import win32com.client
     import pythoncom
+    import pywintypes
     OUTLOOK_AVAILABLE = True
 except ImportError as e:
     OUTLOOK_ERROR = "pywin32가 설치되지 않았습니다. Windows에서만 지원됩니다."
 except Exception as e:
     OUTLOOK_ERROR = str(e)
 
+# 디렉토리 변환 시 EML 파싱을 병렬로 처리할 스레드 수
+# (Outlook 호출 자체는 작업 스레드 하나에서 순차 처리)
+PARSE_WORKERS = 4
+
+# base64 첨부파일을 나눠서 디코딩할 단위 (문자 수)
+BASE64_CHUNK_SIZE = 64 * 1024
+
+# 파일 이름에 쓸 수 없는 문자 (Windows 예약 문자, 경로 구분자, 제어 문자)
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# 접힌 헤더의 줄바꿈 (compat32는 헤더를 접힌 그대로 반환)
+_FOLD_RE = re.compile(r'\r?\n[ \t]+')
+
+
+# 한 번 연결에 성공하면 이후 확인은 생략 (실패는 다시 시도할 수 있도록 캐시하지 않음)
+_outlook_confirmed = False
+
 
 def check_outlook_available() -> tuple:
     """Outlook 사용 가능 여부 확인"""
+    global _outlook_confirmed
+    
     if not OUTLOOK_AVAILABLE:
         return False, OUTLOOK_ERROR
     
+    if _outlook_confirmed:
+        return True, None
+    
     try:
         pythoncom.CoInitialize()
         outlook = win32com.client.Dispatch("Outlook.Application")
         namespace = outlook.GetNamespace("MAPI")
         pythoncom.CoUninitialize()
+        _outlook_confirmed = True
         return True, None
     except Exception as e:
         try:
@@ -56,6 +91,200 @@ def check_outlook_available() -> tuple:
         return False, f"Outlook을 시작할 수 없습니다: {e}"
 
 
+def _decode_8bit(data: bytes, charset: str = None) -> str:
+    """8비트 헤더 바이트 디코딩 (charset을 모르면 UTF-8 우선, 실패 시 cp949)"""
+    if charset and charset != 'unknown-8bit':
+        try:
+            return data.decode(charset, errors='replace')
+        except LookupError:
+            pass
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('cp949', errors='replace')
+
+
+def _header_str(value) -> str:
+    """
+    헤더 값을 접힌 줄을 펼친 문자열로 변환 (RFC 2047 인코딩은 그대로 둠)
+    
+    compat32는 인코딩 없이 8비트 문자(한글 등)가 들어 있는 헤더를 Header 객체로
+    반환하고, str()은 이를 대체 문자로 바꾸므로 원래 바이트에서 다시 디코딩함
+    """
+    if isinstance(value, Header):
+        value = ''.join(_decode_8bit(data, charset) for data, charset in decode_header(value))
+    return _FOLD_RE.sub(' ', str(value))
+
+
+def _part_filename(part) -> str:
+    """첨부파일 이름 (8비트 문자가 그대로 들어 있는 헤더도 원래 바이트에서 디코딩)"""
+    headers = [(name, part.get(name)) for name in ('Content-Disposition', 'Content-Type')]
+    if not any(isinstance(value, Header) for _, value in headers):
+        return _decode_header_value(part.get_filename())
+    
+    # 디코딩한 헤더 문자열로 매개변수(filename/name)를 다시 해석
+    helper = email.message.Message()
+    for name, value in headers:
+        if value is not None:
+            helper[name] = _header_str(value)
+    return _decode_header_value(helper.get_filename())
+
+
+def _decode_header_value(value) -> str:
+    """RFC 2047 인코딩된 헤더 값(=?utf-8?b?...?=)을 문자열로 디코딩 (접힌 줄은 펼침)"""
+    if not value:
+        return ""
+    
+    value = _header_str(value)
+    if '=?' not in value:
+        return value
+    
+    try:
+        return str(make_header(decode_header(value)))
+    except Exception:
+        return value
+
+
+def _find_eml_files(directory: Path, recursive: bool) -> List[Path]:
+    """디렉토리에서 .eml 파일 목록 검색 (확장자 대소문자 무시)"""
+    if recursive:
+        return [
+            Path(root, name)
+            for root, _, names in os.walk(directory)
+            for name in names
+            if name.lower().endswith('.eml')
+        ]
+    
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith('.eml')
+        ]
+
+
+def _safe_filename(filename: str) -> str:
+    """첨부파일 이름을 임시 디렉토리 안에서만 쓰이는 안전한 파일 이름으로 변환"""
+    filename = _SANITIZE_RE.sub('_', filename).strip(' .')
+    return filename or 'attachment.bin'
+
+
+def _write_payload(part, f) -> int:
+    """
+    첨부파일 파트의 디코딩된 내용을 파일에 기록
+    
+    base64 파트는 일정 크기씩 나눠서 디코딩하여, 디코딩된 전체 데이터를
+    메모리에 한 번에 만들지 않음
+    
+    Returns:
+        기록한 바이트 수
+    """
+    if part.get('Content-Transfer-Encoding', '').strip().lower() != 'base64':
+        payload = part.get_payload(decode=True)
+        if payload:
+            f.write(payload)
+            return len(payload)
+        return 0
+    
+    raw = part.get_payload()
+    written = 0
+    leftover = ''
+    
+    try:
+        for start in range(0, len(raw), BASE64_CHUNK_SIZE):
+            chunk = leftover + ''.join(raw[start:start + BASE64_CHUNK_SIZE].split())
+            usable = len(chunk) - len(chunk) % 4
+            leftover = chunk[usable:]
+            if usable:
+                data = base64.b64decode(chunk[:usable])
+                f.write(data)
+                written += len(data)
+        if leftover:
+            # 패딩이 빠진 마지막 조각
+            data = base64.b64decode(leftover + '=' * (-len(leftover) % 4))
+            f.write(data)
+            written += len(data)
+    except (binascii.Error, ValueError):
+        # 형식이 잘못된 base64: email 패키지의 관대한 디코더로 다시 기록
+        f.seek(0)
+        f.truncate()
+        payload = part.get_payload(decode=True) or b''
+        f.write(payload)
+        written = len(payload)
+    
+    return written
+
+
+class _OutlookWorker(threading.Thread):
+    """
+    Outlook COM 객체를 소유하는 전용 작업 스레드
+    
+    COM 초기화와 Outlook Dispatch는 이 스레드에서 한 번만 수행하고,
+    이후 변환 작업은 큐로 전달받아 같은 Outlook 인스턴스로 처리함
+    (Outlook이 종료되었거나 COM 오류가 나면 다음 작업에서 다시 연결)
+    """
+    
+    def __init__(self):
+        super().__init__(name="OutlookWorker", daemon=True)
+        self.jobs = queue.Queue()
+        self.outlook = None
+    
+    def submit(self, func, *args) -> Future:
+        """func(outlook, *args)를 작업 스레드에서 실행하도록 예약"""
+        future = Future()
+        self.jobs.put((func, args, future))
+        return future
+    
+    def run(self):
+        pythoncom.CoInitialize()
+        try:
+            while True:
+                func, args, future = self.jobs.get()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(func(self._connect(), *args))
+                except pywintypes.com_error as e:
+                    # 연결이 끊겼을 수 있으므로 다음 작업에서 새로 Dispatch
+                    self.outlook = None
+                    future.set_exception(e)
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            self.outlook = None
+            try:
+                pythoncom.CoUninitialize()
+            except:
+                pass
+    
+    def _connect(self):
+        """Outlook.Application 반환 (연결이 없거나 끊겼으면 새로 연결)"""
+        if self.outlook is not None:
+            try:
+                self.outlook.Version
+                return self.outlook
+            except Exception:
+                # Outlook이 종료됨 - 다시 연결
+                self.outlook = None
+        
+        self.outlook = win32com.client.Dispatch("Outlook.Application")
+        return self.outlook
+
+
+_outlook_worker = None
+_outlook_worker_lock = threading.Lock()
+
+
+def _get_outlook_worker() -> _OutlookWorker:
+    """공유 Outlook 작업 스레드 반환 (최초 호출 시 시작)"""
+    global _outlook_worker
+    with _outlook_worker_lock:
+        if _outlook_worker is None:
+            _outlook_worker = _OutlookWorker()
+            _outlook_worker.start()
+        return _outlook_worker
+
+
 class EMLtoMSGConverter:
     """EML 파일을 MSG 형식으로 변환하는 클래스"""
     
@@ -65,6 +294,10 @@ class EMLtoMSGConverter:
         self.available, self.error = check_outlook_available()
         if self.available:
             self.log("Outlook 연결 성공")
+        
+        # 첨부파일 임시 저장 디렉토리 (변환기 인스턴스당 하나, 소멸 시 삭제)
+        self._tmp = Path(tempfile.mkdtemp(prefix='eml2msg_'))
+        weakref.finalize(self, shutil.rmtree, str(self._tmp), True)
     
     def log(self, message: str):
         """상세 모드에서만 메시지 출력"""
@@ -106,30 +339,19 @@ class EMLtoMSGConverter:
         
         self.log(f"변환 중: {eml_path.name}")
         
-        # EML 파일 파싱
+        # EML 파일 파싱 (compat32: 헤더를 원문 그대로 두고 필요한 것만 디코딩)
         with open(eml_path, 'rb') as f:
-            msg = BytesParser(policy=policy.default).parse(f)
+            msg = BytesParser(policy=policy.compat32).parse(f)
         
-        # COM 초기화 (현재 스레드에서)
-        pythoncom.CoInitialize()
+        # Outlook 작업 스레드에서 MSG 파일 생성
+        future = _get_outlook_worker().submit(
+            self._create_msg_via_outlook, msg, output_path
+        )
+        future.result()
         
-        try:
-            # Outlook 인스턴스 생성 (현재 스레드에서)
-            outlook = win32com.client.Dispatch("Outlook.Application")
-            
-            # MSG 파일 생성
-            self._create_msg_via_outlook(outlook, msg, output_path)
-            
-            self.log(f"저장됨: {output_path.name}")
-            
-            return str(output_path)
-            
-        finally:
-            # COM 정리 (현재 스레드에서)
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+        self.log(f"저장됨: {output_path.name}")
+        
+        return str(output_path)
     
     def _create_msg_via_outlook(self, outlook, email_msg, output_path: Path):
         """Outlook COM을 사용하여 MSG 파일 생성"""
@@ -138,43 +360,32 @@ class EMLtoMSGConverter:
         mail_item = outlook.CreateItem(0)  # 0 = olMailItem
         
         # 제목 설정
-        subject = email_msg.get('Subject', '')
+        subject = _decode_header_value(email_msg.get('Subject', ''))
         mail_item.Subject = subject
         
-        # 본문 설정
+        # 본문 추출 + 첨부파일 수집 (MIME 트리 한 번만 순회)
         body = ""
         html_body = ""
+        attachment_parts = []
         
         if email_msg.is_multipart():
             for part in email_msg.walk():
-                content_type = part.get_content_type()
                 content_disposition = part.get_content_disposition()
                 
-                if content_disposition != 'attachment':
-                    if content_type == 'text/plain' and not body:
-                        try:
-                            body = part.get_content()
-                        except:
-                            payload = part.get_payload(decode=True)
-                            if payload:
-                                body = payload.decode('utf-8', errors='replace')
-                    elif content_type == 'text/html' and not html_body:
-                        try:
-                            html_body = part.get_content()
-                        except:
-                            payload = part.get_payload(decode=True)
-                            if payload:
-                                html_body = payload.decode('utf-8', errors='replace')
+                if content_disposition == 'attachment':
+                    attachment_parts.append(part)
+                    continue
+                
+                content_type = part.get_content_type()
+                if content_type == 'text/plain' and not body:
+                    body = self._decode_part(part)
+                elif content_type == 'text/html' and not html_body:
+                    html_body = self._decode_part(part)
         else:
-            try:
-                if email_msg.get_content_type() == 'text/html':
-                    html_body = email_msg.get_content()
-                else:
-                    body = email_msg.get_content()
-            except:
-                payload = email_msg.get_payload(decode=True)
-                if payload:
-                    body = payload.decode('utf-8', errors='replace')
+            if email_msg.get_content_type() == 'text/html':
+                html_body = self._decode_part(email_msg)
+            else:
+                body = self._decode_part(email_msg)
         
         if html_body:
             mail_item.HTMLBody = html_body
@@ -204,59 +415,55 @@ class EMLtoMSGConverter:
                         pass
         
         # 첨부파일 처리
-        if email_msg.is_multipart():
-            for part in email_msg.walk():
-                if part.get_content_disposition() == 'attachment':
-                    filename = part.get_filename()
-                    if filename:
-                        payload = part.get_payload(decode=True)
-                        if payload:
-                            temp_dir = tempfile.mkdtemp()
-                            temp_path = os.path.join(temp_dir, filename)
-                            try:
-                                with open(temp_path, 'wb') as f:
-                                    f.write(payload)
-                                mail_item.Attachments.Add(temp_path)
-                            finally:
-                                try:
-                                    os.remove(temp_path)
-                                    os.rmdir(temp_dir)
-                                except:
-                                    pass
+        # Outlook은 파일명을 첨부파일 이름으로 쓰므로 원래 이름 그대로 저장하고,
+        # 추가 직후 삭제하여 같은 이름의 다음 첨부파일과 겹치지 않게 함
+        for part in attachment_parts:
+            filename = _part_filename(part)
+            if filename:
+                temp_path = self._tmp / _safe_filename(filename)
+                try:
+                    with open(temp_path, 'wb') as f:
+                        written = _write_payload(part, f)
+                    if written:
+                        mail_item.Attachments.Add(str(temp_path))
+                finally:
+                    try:
+                        temp_path.unlink()
+                    except:
+                        pass
         
         # MSG 파일로 저장
         mail_item.SaveAs(str(output_path), 3)  # 3 = olMSG
         
         self.log(f"MSG 파일 생성 완료: {output_path}")
     
+    def _decode_part(self, part) -> str:
+        """MIME 파트 본문을 문자열로 추출 (디코딩 실패 시 대체 문자 사용)"""
+        payload = part.get_payload(decode=True)
+        if not payload:
+            return ""
+        
+        charset = part.get_content_charset() or 'utf-8'
+        try:
+            return payload.decode(charset, errors='replace')
+        except LookupError:
+            # 알 수 없는 charset
+            return payload.decode('utf-8', errors='replace')
+    
     def _split_addresses(self, addr_str: str) -> List[str]:
-        """여러 이메일 주소 분리"""
+        """
+        여러 이메일 주소 분리 (쉼표/세미콜론)
+        
+        표시 이름이 있으면 '"이름" <주소>' 형식으로 유지
+        """
         if not addr_str:
             return []
         
-        addresses = []
-        current = ""
-        in_quotes = False
-        in_brackets = False
-        
-        for char in addr_str:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == '<':
-                in_brackets = True
-            elif char == '>':
-                in_brackets = False
-            elif char in ',;' and not in_quotes and not in_brackets:
-                if current.strip():
-                    addresses.append(current.strip())
-                current = ""
-                continue
-            current += char
-        
-        if current.strip():
-            addresses.append(current.strip())
-        
-        return addresses
+        return [
+            f'"{_decode_header_value(name)}" <{addr}>' if name else addr
+            for name, addr in getaddresses([_header_str(addr_str)])
+            if addr
+        ]
     
     def convert_directory(self, directory: str, recursive: bool = False, 
                          output_dir: str = None) -> list:
@@ -272,13 +479,8 @@ class EMLtoMSGConverter:
         if not directory.is_dir():
             raise ValueError(f"디렉토리가 아닙니다: {directory}")
         
-        # EML 파일 검색
-        if recursive:
-            eml_files = list(directory.rglob('*.eml')) + list(directory.rglob('*.EML'))
-        else:
-            eml_files = list(directory.glob('*.eml')) + list(directory.glob('*.EML'))
-        
-        eml_files = list(set(eml_files))
+        # EML 파일 검색 (확장자 대소문자 무시, 한 번만 순회, 이름순 정렬)
+        eml_files = sorted(_find_eml_files(directory, recursive))
         
         if not eml_files:
             print(f"EML 파일을 찾을 수 없습니다: {directory}")
@@ -289,20 +491,29 @@ class EMLtoMSGConverter:
         converted = []
         errors = []
         
-        for eml_file in eml_files:
-            try:
+        # 파싱은 여러 스레드에서 진행하고, 그동안 Outlook 작업 스레드는
+        # 앞서 파싱이 끝난 메시지를 순서대로 저장
+        with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+            futures = {}
+            for eml_file in eml_files:
                 if output_dir:
                     output_path = Path(output_dir) / eml_file.with_suffix('.msg').name
                 else:
                     output_path = eml_file.with_suffix('.msg')
                 
-                result = self.convert_file(str(eml_file), str(output_path))
-                converted.append(result)
-                print(f"✓ {eml_file.name}")
-                
-            except Exception as e:
-                errors.append((str(eml_file), str(e)))
-                print(f"✗ {eml_file.name}: {e}")
+                future = executor.submit(self.convert_file, str(eml_file), str(output_path))
+                futures[future] = eml_file
+            
+            # 제출(정렬된 파일) 순서대로 결과를 모아 출력/반환 순서를 고정
+            for future, eml_file in futures.items():
+                try:
+                    result = future.result()
+                    converted.append(result)
+                    print(f"✓ {eml_file.name}")
+                    
+                except Exception as e:
+                    errors.append((str(eml_file), str(e)))
+                    print(f"✗ {eml_file.name}: {e}")
         
         print(f"\n변환 완료: {len(converted)}개 성공, {len(errors)}개 실패")
         
@@ -15,17 +15,24 @@ EML to PST Converter
 
 import os
 import sys
+import gc
 import email
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from email import policy
-from email.parser import BytesParser
-from email.utils import parsedate_to_datetime
+from email.parser import BytesParser, BytesHeaderParser
+from email.utils import getaddresses, parsedate_to_datetime
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Iterable
 import logging
 import re
 
+from .eml_to_msg import _find_eml_files, _safe_filename, _write_payload
+
 logger = logging.getLogger(__name__)
 
 # Windows/Outlook 체크
@@ -42,6 +49,51 @@ except Exception as e:
     OUTLOOK_ERROR = str(e)
 
 
+# EML 파싱 스레드 수 (COM 호출은 한 스레드에서만)
+PARSE_WORKERS = 4
+
+# 한 번에 처리할 EML 수 (이 개수마다 COM 참조 정리 및 진행 상황 기록)
+CHUNK_SIZE = 500
+
+# 첨부파일 임시 파일 쓰기 버퍼 크기
+ATTACHMENT_BUFFER_SIZE = 1 << 20
+
+# 이메일 주소 파싱용 정규식 ("Name <email>" / "email")
+_ADDR_NAME_RE = re.compile(r'^"?([^"<]*)"?\s*<([^>]+)>$')
+_ADDR_EMAIL_RE = re.compile(r'^([^@\s]+@[^@\s]+)$')
+# 이 문자가 없으면 단순 "a@b, c@d" 형식으로 보고 빠르게 분리
+_ADDR_SPECIAL_RE = re.compile(r'["<>()\\:]')
+
+
+# 스레드별 Outlook 연결 캐시 (COM 객체는 생성한 스레드에서만 사용 가능)
+_com_local = threading.local()
+
+
+def _get_outlook():
+    """
+    현재 스레드의 Outlook.Application 반환 (없거나 끊겼으면 새로 연결)
+    
+    COM 초기화와 Dispatch는 스레드당 한 번만 수행하고,
+    이후 호출에서는 Version 조회로 연결이 살아 있는지만 확인한다.
+    """
+    outlook = getattr(_com_local, 'outlook', None)
+    if outlook is not None:
+        try:
+            outlook.Version
+            return outlook
+        except Exception:
+            # Outlook이 종료됨 - 다시 연결
+            _com_local.outlook = None
+    
+    if not getattr(_com_local, 'com_initialized', False):
+        pythoncom.CoInitialize()
+        _com_local.com_initialized = True
+    
+    outlook = win32com.client.Dispatch("Outlook.Application")
+    _com_local.outlook = outlook
+    return outlook
+
+
 def check_outlook_available() -> tuple:
     """
     Outlook 사용 가능 여부 확인
@@ -52,17 +104,26 @@ def check_outlook_available() -> tuple:
     if not OUTLOOK_AVAILABLE:
         return False, OUTLOOK_ERROR
     
+    # 호출 스레드(GUI 등)에 COM 상태나 Outlook 참조를 남기지 않도록
+    # 스레드 캐시(_get_outlook)를 쓰지 않고 초기화/해제를 짝으로 수행
+    pythoncom.CoInitialize()
+    outlook = None
     try:
         outlook = win32com.client.Dispatch("Outlook.Application")
-        namespace = outlook.GetNamespace("MAPI")
+        outlook.GetNamespace("MAPI")
         return True, None
     except Exception as e:
         return False, f"Outlook을 시작할 수 없습니다: {e}"
+    finally:
+        # COM 해제 전에 참조를 먼저 놓아야 함
+        outlook = None
+        pythoncom.CoUninitialize()
 
 
-def generate_folder_name() -> str:
+def generate_folder_name(now: datetime = None) -> str:
     """변환 폴더 이름 생성 (날짜/시간 포함)"""
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
     return f"Converted Mails ({now.strftime('%Y-%m-%d %H.%M')})"
 
 
@@ -80,8 +141,12 @@ class EMLtoPSTConverter:
     MSGFLAG_READ = 0x0001
     MSGFLAG_UNSENT = 0x0008  # 이 플래그가 있으면 초안/작성중
     
-    def __init__(self, verbose: bool = False):
+    # 첨부 방식: 파일 내용을 메시지에 복사 (olByValue)
+    OL_BY_VALUE = 1
+    
+    def __init__(self, verbose: bool = False, chunk_size: int = CHUNK_SIZE):
         self.verbose = verbose
+        self.chunk_size = chunk_size
         self.outlook = None
         self.namespace = None
     
@@ -96,34 +161,29 @@ class EMLtoPSTConverter:
         return check_outlook_available()
     
     def _init_outlook(self):
-        """Outlook 초기화 (현재 스레드에서)"""
+        """Outlook 초기화 (현재 스레드의 캐시된 연결 사용)"""
         try:
-            # 항상 현재 스레드에서 COM 초기화
-            pythoncom.CoInitialize()
-            self.outlook = win32com.client.Dispatch("Outlook.Application")
+            self.outlook = _get_outlook()
             self.namespace = self.outlook.GetNamespace("MAPI")
             self.log("Outlook 연결 성공")
         except Exception as e:
             raise RuntimeError(f"Outlook 초기화 실패: {e}")
     
     def _cleanup_outlook(self):
-        """Outlook 정리 (현재 스레드에서)"""
-        try:
-            self.namespace = None
-            self.outlook = None
-            pythoncom.CoUninitialize()
-        except:
-            pass
+        """Outlook 참조 해제 (연결 자체는 다음 변환을 위해 스레드 캐시에 유지)"""
+        self.namespace = None
+        self.outlook = None
     
-    def convert_files(self, eml_paths: List[str], pst_path: str, 
-                      folder_name: str = None) -> str:
+    def convert_files(self, eml_paths: Iterable[str], pst_path: str, 
+                      folder_name: str = None, total: Optional[int] = None) -> str:
         """
         여러 EML 파일을 하나의 PST 파일로 변환
         
         Args:
-            eml_paths: EML 파일 경로 리스트
+            eml_paths: EML 파일 경로 목록 (리스트 또는 제너레이터 등 iterable)
             pst_path: 생성할 PST 파일 경로
             folder_name: PST 내 폴더 이름 (None이면 자동 생성)
+            total: 전체 파일 수 (진행 로그용, None이면 len()으로 확인)
             
         Returns:
             생성된 PST 파일 경로
@@ -133,10 +193,13 @@ class EMLtoPSTConverter:
             raise RuntimeError(f"Outlook을 사용할 수 없습니다: {error}")
         
         pst_path = Path(pst_path)
+        if total is None and hasattr(eml_paths, '__len__'):
+            total = len(eml_paths)
         
-        # 폴더 이름 자동 생성
+        # 폴더 이름 자동 생성 (루트 폴더 표시 이름과 같은 시각 사용)
+        now = datetime.now()
         if folder_name is None:
-            folder_name = generate_folder_name()
+            folder_name = generate_folder_name(now)
         
         try:
             self._init_outlook()
@@ -151,12 +214,17 @@ class EMLtoPSTConverter:
             # 새 PST 스토어 추가
             self.namespace.AddStoreEx(str(pst_path), 1)  # 1 = olStoreDefault
             
-            # 새로 추가된 PST 스토어 찾기
-            pst_store = None
-            for store in self.namespace.Stores:
-                if str(pst_path).lower() in store.FilePath.lower():
-                    pst_store = store
-                    break
+            # 새로 추가된 PST 스토어 찾기: 방금 추가한 스토어는 컬렉션의 마지막에 위치
+            # (경로 확인은 한 번만 하고, 맞지 않을 때만 전체 검색)
+            target = str(pst_path).lower()
+            stores = self.namespace.Stores
+            pst_store = stores.Item(stores.Count)
+            if target not in pst_store.FilePath.lower():
+                pst_store = None
+                for store in stores:
+                    if target in store.FilePath.lower():
+                        pst_store = store
+                        break
             
             if not pst_store:
                 raise RuntimeError("PST 스토어를 찾을 수 없습니다")
@@ -166,7 +234,7 @@ class EMLtoPSTConverter:
             
             # 루트 폴더 이름 변경 (PST 파일명의 표시 이름)
             try:
-                pst_display_name = f"Imported ({datetime.now().strftime('%Y-%m-%d %H:%M')})"
+                pst_display_name = f"Imported ({now.strftime('%Y-%m-%d %H:%M')})"
                 root_folder.Name = pst_display_name
             except Exception as e:
                 self.log(f"루트 폴더 이름 변경 실패: {e}")
@@ -181,37 +249,71 @@ class EMLtoPSTConverter:
             
             # 각 EML 파일 처리
             success_count = 0
-            error_count = 0
+            failures = []  # (경로, 오류) - 끝에서 한 번에 기록
             
-            for eml_path in eml_paths:
-                try:
-                    self._import_eml_as_received(eml_path, import_folder)
-                    success_count += 1
-                    self.log(f"추가됨: {Path(eml_path).name}")
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"EML 추가 실패 {eml_path}: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+            # 첨부파일 임시 저장 디렉토리 (변환 작업 전체에서 하나만 사용)
+            # EML 파싱은 여러 스레드에서 미리 진행하고, COM 호출은 Outlook을
+            # 연결한 현재 스레드에서 원래 순서대로 처리
+            # (미리 파싱해 두는 메시지 수는 PARSE_WORKERS * 2개로 제한)
+            with tempfile.TemporaryDirectory(prefix='eml2pst_') as temp_dir, \
+                    ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+                pending = deque()
+                paths = iter(eml_paths)
+                
+                for eml_path in islice(paths, PARSE_WORKERS * 2):
+                    pending.append((eml_path, executor.submit(self._parse_eml, eml_path)))
+                
+                while pending:
+                    eml_path, future = pending.popleft()
+                    next_path = next(paths, None)
+                    if next_path is not None:
+                        pending.append((next_path, executor.submit(self._parse_eml, next_path)))
+                    
+                    try:
+                        self._import_eml_as_received(eml_path, import_folder, Path(temp_dir),
+                                                     parsed=future.result())
+                        success_count += 1
+                        self.log(f"추가됨: {Path(eml_path).name}")
+                    except Exception as e:
+                        failures.append((eml_path, repr(e)))
+                        # 실패한 파일과 원인은 항상 기록, 스택 트레이스는 DEBUG 로그가 켜져 있을 때만 생성
+                        logger.warning("EML 추가 실패 %s: %s", eml_path, e)
+                        logger.debug("EML 추가 실패 상세 %s", eml_path, exc_info=True)
+                    
+                    # chunk_size개마다 COM 참조를 정리하고 폴더를 다시 가져와
+                    # Outlook 쪽에 쌓이는 상태를 줄임
+                    done = success_count + len(failures)
+                    if self.chunk_size and done % self.chunk_size == 0 and pending:
+                        import_folder = self._refresh_folder(import_folder, pst_store)
+                        self.log(f"진행: {done}/{total if total is not None else '?'}개 처리")
+            
+            if failures:
+                logger.error("EML 추가 실패 %d개: %s", len(failures), failures[:20])
             
-            self.log(f"변환 완료: {success_count}개 성공, {error_count}개 실패")
+            self.log(f"변환 완료: {success_count}개 성공, {len(failures)}개 실패")
             
             return str(pst_path)
             
         finally:
             self._cleanup_outlook()
     
-    def _import_eml_as_received(self, eml_path: str, folder):
+    def _parse_eml(self, eml_path: str) -> dict:
         """
-        EML 파일을 '받은 메일'로 가져오기 (초안 아님)
+        EML 파일을 읽어 Outlook 아이템 생성에 필요한 정보 추출
         
-        핵심: PostItem을 사용하거나, MailItem 저장 후 MAPI 속성 수정
+        COM을 사용하지 않으므로 다른 스레드에서 미리 실행할 수 있음
         """
         eml_path = Path(eml_path)
         
-        # EML 파일 파싱
+        # EML 파일 파싱: 헤더만 먼저 읽고, 파트를 나눠야 하는 multipart만 전체 파싱
+        # (단일 파트는 헤더 파싱 결과의 나머지가 곧 본문)
         with open(eml_path, 'rb') as f:
-            msg = BytesParser(policy=policy.default).parse(f)
+            msg = BytesHeaderParser(policy=policy.default).parse(f)
+            # Content-Type은 한 번만 해석해 두고 아래에서 재사용
+            content_type = msg.get_content_type()
+            if content_type.startswith('multipart/'):
+                f.seek(0)
+                msg = BytesParser(policy=policy.default).parse(f)
         
         # 발신자/수신자 정보 추출
         from_addr = msg.get('From', '')
@@ -228,34 +330,30 @@ class EMLtoPSTConverter:
             except:
                 pass
         
-        # 본문 추출
+        # 본문 추출 + 첨부파일 수집
         body = ""
         html_body = ""
+        attachment_parts = []
         
         if msg.is_multipart():
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                content_disposition = part.get_content_disposition()
-                
-                # 첨부파일이 아닌 경우만 본문으로 처리
-                if content_disposition != 'attachment':
-                    if content_type == 'text/plain' and not body:
-                        try:
-                            body = part.get_content()
-                        except:
-                            payload = part.get_payload(decode=True)
-                            if payload:
-                                body = payload.decode('utf-8', errors='replace')
-                    elif content_type == 'text/html' and not html_body:
-                        try:
-                            html_body = part.get_content()
-                        except:
-                            payload = part.get_payload(decode=True)
-                            if payload:
-                                html_body = payload.decode('utf-8', errors='replace')
+            # HTML 우선, 없으면 일반 텍스트 (첨부파일로 지정된 파트는 제외)
+            body_part = msg.get_body(preferencelist=('html', 'plain'))
+            if body_part is not None:
+                if body_part.get_content_type() == 'text/html':
+                    html_body = self._decode_part(body_part)
+                else:
+                    body = self._decode_part(body_part)
+            
+            # 첨부파일 (중첩된 multipart/전달된 메시지 안의 첨부파일까지 전체 트리에서 수집)
+            attachment_parts = [
+                part for part in msg.walk()
+                if part is not body_part and not part.is_multipart()
+                and (part.is_attachment() or part.get_filename())
+            ]
         else:
+            # 단일 파트 (경계를 찾지 못한 multipart도 원문 그대로 본문으로 사용)
             try:
-                if msg.get_content_type() == 'text/html':
+                if content_type == 'text/html':
                     html_body = msg.get_content()
                 else:
                     body = msg.get_content()
@@ -264,14 +362,59 @@ class EMLtoPSTConverter:
                 if payload:
                     body = payload.decode('utf-8', errors='replace')
         
+        return {
+            'from_addr': from_addr,
+            'to_addr': to_addr,
+            'cc_addr': cc_addr,
+            'subject': subject,
+            'received_time': received_time,
+            'body': body,
+            'html_body': html_body,
+            'attachment_parts': attachment_parts,
+        }
+    
+    def _refresh_folder(self, folder, store):
+        """대기 중인 COM 메시지를 처리하고 폴더 객체를 새로 가져오기"""
+        pythoncom.PumpWaitingMessages()
+        gc.collect()
+        try:
+            return self.namespace.GetFolderFromID(folder.EntryID, store.StoreID)
+        except Exception as e:
+            self.log(f"폴더 다시 가져오기 실패: {e}")
+            return folder
+    
+    def _import_eml_as_received(self, eml_path: str, folder, temp_dir: Path,
+                                parsed: dict = None):
+        """
+        EML 파일을 '받은 메일'로 가져오기 (초안 아님)
+        
+        temp_dir: 첨부파일을 잠시 저장할 디렉토리
+        parsed: _parse_eml() 결과 (None이면 여기서 파싱)
+        
+        핵심: PostItem을 사용하거나, MailItem 저장 후 MAPI 속성 수정
+        """
+        if parsed is None:
+            parsed = self._parse_eml(eml_path)
+        
+        from_addr = parsed['from_addr']
+        to_addr = parsed['to_addr']
+        cc_addr = parsed['cc_addr']
+        subject = parsed['subject']
+        received_time = parsed['received_time']
+        body = parsed['body']
+        html_body = parsed['html_body']
+        attachment_parts = parsed['attachment_parts']
+        
         # 방법 1: PostItem 사용 (받은 메일처럼 표시)
         # PostItem은 저장 시 초안으로 표시되지 않음
         try:
             # 대상 폴더에 직접 아이템 생성
             mail_item = folder.Items.Add("IPM.Note")
+            needs_move = False
         except:
-            # 폴백: 일반 MailItem 생성
+            # 폴백: 일반 MailItem 생성 (저장 후 대상 폴더로 이동)
             mail_item = self.outlook.CreateItem(0)
+            needs_move = True
         
         # 기본 속성 설정
         mail_item.Subject = subject
@@ -281,26 +424,8 @@ class EMLtoPSTConverter:
         else:
             mail_item.Body = body or ""
         
-        # 발신자 정보 설정 (SenderName, SenderEmailAddress)
-        try:
-            # PropertyAccessor를 사용하여 발신자 정보 설정
-            prop_accessor = mail_item.PropertyAccessor
-            
-            # 발신자 이름과 이메일 파싱
-            sender_name, sender_email = self._parse_email_address(from_addr)
-            
-            if sender_name:
-                try:
-                    prop_accessor.SetProperty(self.PR_SENDER_NAME, sender_name)
-                except:
-                    pass
-            if sender_email:
-                try:
-                    prop_accessor.SetProperty(self.PR_SENDER_EMAIL_ADDRESS, sender_email)
-                except:
-                    pass
-        except Exception as e:
-            self.log(f"발신자 설정 실패: {e}")
+        # 발신자 이름과 이메일 파싱 (속성은 저장 후 다른 MAPI 속성과 함께 설정)
+        sender_name, sender_email = self._parse_email_address(from_addr)
         
         # 수신자 추가 (To)
         if to_addr:
@@ -329,74 +454,78 @@ class EMLtoPSTConverter:
             pass
         
         # 첨부파일 처리
-        if msg.is_multipart():
-            for part in msg.walk():
-                if part.get_content_disposition() == 'attachment':
-                    filename = part.get_filename()
-                    if filename:
-                        payload = part.get_payload(decode=True)
-                        if payload:
-                            temp_dir = tempfile.mkdtemp()
-                            temp_path = os.path.join(temp_dir, filename)
-                            try:
-                                with open(temp_path, 'wb') as f:
-                                    f.write(payload)
-                                mail_item.Attachments.Add(temp_path)
-                            finally:
-                                try:
-                                    os.remove(temp_path)
-                                    os.rmdir(temp_dir)
-                                except:
-                                    pass
-        
-        # 먼저 저장하여 메시지 생성
-        mail_item.Save()
+        # Outlook은 파일명을 첨부파일 이름으로 쓰므로 원래 이름 그대로 저장하고,
+        # 추가 직후 삭제하여 같은 이름의 다음 첨부파일과 겹치지 않게 함
+        # (base64는 조각 단위로 디코딩하여 파일에 바로 기록)
+        # Attachments.Add는 파일 경로만 받으므로 메모리의 데이터를 바로 넘길 수 없음
+        # (ADODB.Stream/명명된 파이프도 결국 파일 경로가 필요) - 임시 파일 한 번만 거침
+        for part in attachment_parts:
+            filename = part.get_filename()
+            if filename:
+                temp_path = temp_dir / _safe_filename(filename)
+                try:
+                    with open(temp_path, 'wb', buffering=ATTACHMENT_BUFFER_SIZE) as f:
+                        written = _write_payload(part, f)
+                    if written:
+                        mail_item.Attachments.Add(str(temp_path), self.OL_BY_VALUE)
+                finally:
+                    try:
+                        temp_path.unlink()
+                    except:
+                        pass
         
         # MAPI 속성 수정하여 '받은 메일'로 표시
-        # 핵심: MSGFLAG_UNSENT 비트를 클리어해야 함
+        # 핵심: MSGFLAG_UNSENT 비트를 클리어해야 함 (PR_MESSAGE_FLAGS는 첫 저장 전까지만 변경 가능)
+        # 방금 만든 아이템이므로 현재 플래그를 읽지 않고 '읽음'만 설정하며,
+        # 발신자/시간 속성과 함께 SetProperties 한 번으로 기록
         try:
             prop_accessor = mail_item.PropertyAccessor
             
-            # 현재 메시지 플래그 읽기
-            try:
-                current_flags = prop_accessor.GetProperty(self.PR_MESSAGE_FLAGS)
-            except:
-                current_flags = self.MSGFLAG_UNSENT  # 기본값: 미발송
-            
-            # MSGFLAG_UNSENT (0x0008) 비트 클리어
-            # 비트 AND NOT 연산으로 해당 비트만 제거
-            new_flags = current_flags & (~self.MSGFLAG_UNSENT)
-            
-            # MSGFLAG_READ (0x0001) 비트 추가 (읽음 상태)
-            new_flags = new_flags | self.MSGFLAG_READ
-            
-            self.log(f"플래그 변경: 0x{current_flags:08X} -> 0x{new_flags:08X}")
-            
-            # 새 플래그 설정
-            prop_accessor.SetProperty(self.PR_MESSAGE_FLAGS, new_flags)
+            tags = [self.PR_MESSAGE_FLAGS]
+            values = [self.MSGFLAG_READ]
             
             # 받은 시간 설정
             if received_time:
-                try:
-                    prop_accessor.SetProperty(self.PR_MESSAGE_DELIVERY_TIME, received_time)
-                    prop_accessor.SetProperty(self.PR_CLIENT_SUBMIT_TIME, received_time)
-                except Exception as e:
-                    self.log(f"시간 설정 실패: {e}")
+                tags += [self.PR_MESSAGE_DELIVERY_TIME, self.PR_CLIENT_SUBMIT_TIME]
+                values += [received_time, received_time]
+            
+            # 발신자 정보 설정 (SenderName, SenderEmailAddress)
+            if sender_name:
+                tags.append(self.PR_SENDER_NAME)
+                values.append(sender_name)
+            if sender_email:
+                tags.append(self.PR_SENDER_EMAIL_ADDRESS)
+                values.append(sender_email)
             
-            # 변경사항 저장
-            mail_item.Save()
+            # 속성별 오류 코드 배열 반환 (성공한 속성은 0/빈 값)
+            errors = prop_accessor.SetProperties(tags, values)
+            for tag, error in zip(tags, errors or ()):
+                if error:
+                    self.log(f"속성 설정 실패 {tag}: {error}")
             
         except Exception as e:
             self.log(f"MAPI 속성 설정 실패: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("MAPI 속성 설정 실패", exc_info=True)
         
-        # 아이템이 다른 폴더에 있으면 대상 폴더로 이동
-        try:
-            if mail_item.Parent.EntryID != folder.EntryID:
+        # 모든 속성을 설정한 뒤 한 번만 저장
+        mail_item.Save()
+        
+        # 폴백으로 만든 아이템은 대상 폴더로 이동
+        if needs_move:
+            try:
                 mail_item.Move(folder)
+            except:
+                pass
+    
+    def _decode_part(self, part) -> str:
+        """MIME 파트 본문을 문자열로 추출 (디코딩 실패 시 UTF-8 대체 문자 사용)"""
+        try:
+            return part.get_content()
         except:
-            pass
+            payload = part.get_payload(decode=True)
+            if payload:
+                return payload.decode('utf-8', errors='replace')
+            return ""
     
     def _parse_email_address(self, addr_str: str) -> tuple:
         """
@@ -406,47 +535,53 @@ class EMLtoPSTConverter:
         if not addr_str:
             return "", ""
         
-        # "Name <email>" 형식
-        match = re.match(r'^"?([^"<]*)"?\s*<([^>]+)>$', addr_str.strip())
+        addr_str = addr_str.strip()
+        
+        # "Name <email>" 형식: 흔한 경우는 정규식 없이 partition으로 처리
+        if addr_str.endswith('>'):
+            name, _, rest = addr_str.partition('<')
+            email_part = rest[:-1]
+            name = name.rstrip()
+            if len(name) >= 2 and name[0] == '"' and name[-1] == '"':
+                name = name[1:-1]
+            if email_part and '<' not in rest and '>' not in email_part and '"' not in name:
+                return name.strip(), email_part.strip()
+        
+        match = _ADDR_NAME_RE.match(addr_str)
         if match:
             return match.group(1).strip(), match.group(2).strip()
         
         # 이메일만 있는 경우
-        match = re.match(r'^([^@\s]+@[^@\s]+)$', addr_str.strip())
+        match = _ADDR_EMAIL_RE.match(addr_str)
         if match:
             return "", match.group(1)
         
-        return "", addr_str.strip()
+        return "", addr_str
     
     def _split_addresses(self, addr_str: str) -> List[str]:
-        """여러 이메일 주소 분리"""
+        """
+        여러 이메일 주소 분리 (쉼표/세미콜론)
+        
+        표시 이름이 있으면 '"이름" <주소>' 형식으로 유지
+        """
         if not addr_str:
             return []
         
-        # 간단한 분리 (쉼표/세미콜론)
-        addresses = []
-        current = ""
-        in_quotes = False
-        in_brackets = False
-        
-        for char in addr_str:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == '<':
-                in_brackets = True
-            elif char == '>':
-                in_brackets = False
-            elif char in ',;' and not in_quotes and not in_brackets:
-                if current.strip():
-                    addresses.append(current.strip())
-                current = ""
-                continue
-            current += char
-        
-        if current.strip():
-            addresses.append(current.strip())
-        
-        return addresses
+        addr_str = str(addr_str)
+        
+        # 표시 이름/따옴표/주석이 없는 단순 주소 목록은 split으로 바로 처리
+        if not _ADDR_SPECIAL_RE.search(addr_str):
+            return [
+                addr for addr in
+                (a.strip() for a in addr_str.replace(';', ',').split(','))
+                if addr
+            ]
+        
+        return [
+            f'"{name}" <{addr}>' if name else addr
+            for name, addr in getaddresses([addr_str])
+            if addr
+        ]
     
     def convert_directory(self, directory: str, pst_path: str, 
                          recursive: bool = False,
@@ -460,13 +595,8 @@ class EMLtoPSTConverter:
         if not directory.is_dir():
             raise ValueError(f"디렉토리가 아닙니다: {directory}")
         
-        # EML 파일 검색
-        if recursive:
-            eml_files = list(directory.rglob('*.eml')) + list(directory.rglob('*.EML'))
-        else:
-            eml_files = list(directory.glob('*.eml')) + list(directory.glob('*.EML'))
-        
-        eml_files = list(set(eml_files))
+        # EML 파일 검색 (확장자 대소문자 무시, 한 번만 순회)
+        eml_files = _find_eml_files(directory, recursive)
         
         if not eml_files:
             print(f"EML 파일을 찾을 수 없습니다: {directory}")
@@ -501,11 +631,12 @@ class EMLtoMBOXConverter:
             
             for eml_path in eml_paths:
                 try:
+                    # EML 원본 바이트를 그대로 추가 (파싱/재직렬화 생략)
+                    # mailbox가 'From ' 구분 줄 추가와 본문의 'From ' 이스케이프를 처리
                     with open(eml_path, 'rb') as f:
-                        msg = BytesParser(policy=policy.default).parse(f)
+                        raw = f.read()
                     
-                    mbox_msg = mailbox.mboxMessage(msg)
-                    mbox.add(mbox_msg)
+                    mbox.add(raw.replace(b'\r\n', b'\n'))
                     
                     self.log(f"추가됨: {Path(eml_path).name}")
                     
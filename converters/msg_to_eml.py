@@ -16,34 +16,130 @@ Microsoft Outlook .msg 파일을 표준 .eml 형식으로 변환하는 프로그
 
 import os
 import sys
+import re
+import uuid
 import argparse
 import email
-from email import policy
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from email.charset import Charset
+from email.generator import Generator
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email.mime.application import MIMEApplication
-from email.utils import formataddr, formatdate, parseaddr
-from email import encoders
+from email.utils import formatdate
 from datetime import datetime
 from pathlib import Path
 
+# 본문/텍스트 파트에 공통으로 쓰는 문자셋 (파트마다 새로 만들지 않음)
+_UTF8 = Charset('utf-8')
+
+# EML 파일 쓰기 버퍼 크기
+WRITE_BUFFER_SIZE = 1 << 20
+
+# --extract-attachments 사용 시 이 크기 이상의 첨부파일만 따로 저장
+EXTRACT_MIN_SIZE = 1024 * 1024
+
+# 저장할 파일 이름에 쓸 수 없는 문자 (Windows 예약 문자, 경로 구분자, 제어 문자)
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# 선택적 가속: SIMD 기반 base64 인코더 (없으면 표준 라이브러리 사용)
 try:
-    import extract_msg
+    from pybase64 import b64encode as _b64encode
 except ImportError:
-    print("=" * 60)
-    print("오류: 'extract-msg' 라이브러리가 설치되지 않았습니다.")
-    print("다음 명령어로 설치해주세요:")
-    print("    pip install extract-msg")
-    print("=" * 60)
-    sys.exit(1)
+    from base64 import b64encode as _b64encode
+
+# extract_msg는 olefile, RTF 디코더 등을 함께 불러와 무거우므로
+# 실제로 MSG 파일을 열 때 처음 import (--help 등은 바로 실행)
+extract_msg = None
+
+
+def _require_extract_msg():
+    """extract_msg 모듈 반환 (최초 호출 시 import)"""
+    global extract_msg
+    if extract_msg is None:
+        try:
+            import extract_msg as module
+        except ImportError:
+            raise ImportError(
+                "'extract-msg' 라이브러리가 설치되지 않았습니다.\n"
+                "다음 명령어로 설치해주세요:\n"
+                "    pip install extract-msg"
+            )
+        extract_msg = module
+    return extract_msg
+
+
+def _attachment_info(attachment) -> tuple:
+    """
+    extract_msg 첨부파일에서 (데이터, 파일명, MIME 타입) 추출
+    
+    속성마다 한 번씩만 조회하고, 없는 값은 기본값으로 대체
+    """
+    data = getattr(attachment, 'data', None) or getattr(attachment, '_data', None)
+    filename = (getattr(attachment, 'longFilename', None) or
+                getattr(attachment, 'shortFilename', None) or
+                getattr(attachment, 'name', None) or
+                'attachment')
+    content_type = getattr(attachment, 'mimetype', None) or 'application/octet-stream'
+    return data, filename, content_type
+
+
+def _iter_msg_files(root, recursive: bool):
+    """디렉토리에서 .msg 파일 경로를 차례로 반환 (확장자 대소문자 무시)"""
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if entry.name.lower().endswith('.msg'):
+                        yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _convert_one(msg_path: str, output_path: str, verbose: bool = False,
+                 extract_dir: str = None) -> str:
+    """작업 프로세스에서 MSG 파일 하나를 변환 (프로세스마다 새 변환기 사용)"""
+    converter = MSGtoEMLConverter(verbose=verbose, extract_dir=extract_dir)
+    return converter.convert_file(msg_path, output_path)
+
+
+def _encode_base64(part, data: bytes):
+    """
+    첨부파일 데이터를 base64로 인코딩하여 파트에 설정
+    
+    encoders.encode_base64와 같은 결과(76자 줄바꿈)를 만들되,
+    57바이트씩 나눠 인코딩하는 대신 한 번에 인코딩한 뒤 줄만 나눔
+    """
+    encoded = _b64encode(data).decode('ascii')
+    lines = [encoded[i:i + 76] for i in range(0, len(encoded), 76)]
+    encdata = ''.join(line + '\n' for line in lines)
+    part.set_payload(encdata)
+    part['Content-Transfer-Encoding'] = 'base64'
 
 
 class MSGtoEMLConverter:
     """MSG 파일을 EML 형식으로 변환하는 클래스"""
     
-    def __init__(self, verbose: bool = False):
+    # MSG 중요도(PR_IMPORTANCE) -> 이름, 이름 -> X-Priority 값
+    IMPORTANCE_MAP = {0: 'low', 1: 'normal', 2: 'high'}
+    PRIORITY_MAP = {'low': '5', 'high': '1'}
+    
+    def __init__(self, verbose: bool = False, extract_dir: str = None):
+        """
+        Args:
+            verbose: 상세 정보 출력 여부
+            extract_dir: 지정하면 큰 첨부파일(EXTRACT_MIN_SIZE 이상)을 이 폴더에 따로 저장하고
+                         EML에는 파일 참조(message/external-body)만 포함
+        """
         self.verbose = verbose
+        self.extract_dir = Path(extract_dir) if extract_dir else None
+    
+    @staticmethod
+    def warm_up():
+        """첫 변환 전에 extract_msg를 미리 로드 (GUI에서 파일 선택 중 호출)"""
+        _require_extract_msg()
     
     def log(self, message: str):
         """상세 모드에서만 메시지 출력"""
@@ -77,27 +173,61 @@ class MSGtoEMLConverter:
         
         self.log(f"변환 중: {msg_path.name}")
         
-        # MSG 파일 열기 (유효성 검사 포함)
+        msg = self._open_msg(str(msg_path), msg_path.name)
+        return self._write_eml(msg, output_path)
+    
+    def convert_stream(self, msg_fp, output_path: str, name: str = 'upload.msg') -> str:
+        """
+        파일 객체(업로드 스트림 등)로부터 MSG를 읽어 EML로 변환
+        
+        Args:
+            msg_fp: MSG 데이터를 담은 탐색 가능한(seekable) 바이너리 파일 객체
+            output_path: 출력 .eml 파일 경로
+            name: 로그/오류 메시지에 표시할 원본 파일명
+            
+        Returns:
+            생성된 .eml 파일 경로
+        """
+        output_path = Path(output_path)
+        
+        self.log(f"변환 중: {name}")
+        
+        msg = self._open_msg(msg_fp, name)
+        return self._write_eml(msg, output_path)
+    
+    def _open_msg(self, source, name: str):
+        """
+        MSG 파일 열기 (유효성 검사 포함)
+        
+        Args:
+            source: MSG 파일 경로 또는 탐색 가능한 바이너리 파일 객체
+            name: 오류 메시지에 표시할 파일명
+        """
+        message_class = _require_extract_msg().Message
+        
         try:
-            msg = extract_msg.Message(str(msg_path))
+            # 첨부파일은 실제로 필요할 때(msg.attachments 접근 시)만 읽음
+            return message_class(source, delayAttachments=True)
         except Exception as e:
             error_str = str(e).lower()
             if 'ole2' in error_str or 'not an ole' in error_str or 'olefileerror' in error_str:
                 raise ValueError(
-                    f"유효한 MSG 파일이 아닙니다: {msg_path.name}\n"
+                    f"유효한 MSG 파일이 아닙니다: {name}\n"
                     f"이 파일은 Outlook MSG 형식(.msg)이 아닙니다.\n"
                     f"파일 확장자만 .msg로 변경된 다른 형식의 파일일 수 있습니다."
                 )
             else:
-                raise ValueError(f"MSG 파일을 열 수 없습니다: {msg_path.name} - {e}")
-        
+                raise ValueError(f"MSG 파일을 열 수 없습니다: {name} - {e}")
+    
+    def _write_eml(self, msg, output_path: Path) -> str:
+        """열린 MSG 객체를 EML 파일로 저장하고 닫음"""
         try:
             # EML 메시지 생성
             eml_message = self._create_eml_message(msg)
             
-            # EML 파일로 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(eml_message.as_string())
+            # EML 파일로 저장 (as_string()으로 전체 문자열을 만들지 않고 파트별로 바로 기록)
+            with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                Generator(f, mangle_from_=False, maxheaderlen=0).flatten(eml_message)
             
             self.log(f"저장됨: {output_path.name}")
             
@@ -150,7 +280,7 @@ class MSGtoEMLConverter:
             self.log(f"텍스트 본문 추출 오류: {e}")
             return None
     
-    def _create_eml_message(self, msg) -> email.message.EmailMessage:
+    def _create_eml_message(self, msg) -> email.message.Message:
         """MSG 객체로부터 EML 메시지 객체 생성"""
         
         # 본문 추출 (인코딩 오류 처리)
@@ -159,126 +289,130 @@ class MSGtoEMLConverter:
         
         has_html = html_body is not None
         has_plain = plain_body is not None
-        has_attachments = len(msg.attachments) > 0 if msg.attachments else False
         
-        if has_attachments or (has_html and has_plain):
-            # multipart 메시지
-            if has_attachments:
-                eml = MIMEMultipart('mixed')
-                
-                # 본문 파트
-                if has_html and has_plain:
-                    body_part = MIMEMultipart('alternative')
-                    body_part.attach(MIMEText(plain_body or '', 'plain', 'utf-8'))
-                    body_part.attach(MIMEText(html_body or '', 'html', 'utf-8'))
-                    eml.attach(body_part)
-                elif has_html:
-                    eml.attach(MIMEText(html_body, 'html', 'utf-8'))
-                elif has_plain:
-                    eml.attach(MIMEText(plain_body, 'plain', 'utf-8'))
-            else:
-                # 첨부파일 없이 HTML과 Plain text만 있는 경우
-                eml = MIMEMultipart('alternative')
-                eml.attach(MIMEText(plain_body or '', 'plain', 'utf-8'))
-                eml.attach(MIMEText(html_body or '', 'html', 'utf-8'))
-        elif has_html:
-            eml = MIMEText(html_body, 'html', 'utf-8')
-        else:
-            eml = MIMEText(plain_body or '', 'plain', 'utf-8')
+        # 첨부파일 유무는 속성 스트림의 개수로 먼저 확인하고,
+        # 실제 첨부파일 목록은 있을 때만 한 번 읽음
+        has_attachments = self._attachment_count(msg) > 0
+        attachments = (msg.attachments or []) if has_attachments else []
+        has_attachments = len(attachments) > 0
+        
+        if not has_attachments:
+            # 첨부파일이 없으면 본문 파트가 곧 메시지
+            eml = self._build_body(html_body, plain_body)
+            self._set_headers(eml, msg)
+            return eml
+        
+        # 첨부파일이 있으면 mixed 안에 본문 파트(있는 경우)와 첨부파일
+        eml = MIMEMultipart('mixed')
+        if has_html or has_plain:
+            eml.attach(self._build_body(html_body, plain_body))
         
         # 헤더 설정
         self._set_headers(eml, msg)
         
         # 첨부파일 추가
-        if has_attachments:
-            self._add_attachments(eml, msg)
+        self._add_attachments(eml, msg, attachments)
         
         return eml
     
-    def _set_headers(self, eml, msg):
-        """이메일 헤더 설정"""
-        
-        # 발신자 - sender가 이미 "이름 <이메일>" 형식의 문자열
-        if msg.sender:
-            eml['From'] = msg.sender
+    def _build_body(self, html_body: str, plain_body: str):
+        """
+        본문 파트 생성
         
-        # 수신자
-        if msg.to:
-            eml['To'] = msg.to
+        HTML과 텍스트가 모두 있으면 multipart/alternative,
+        하나만 있으면 해당 MIMEText (둘 다 없으면 빈 텍스트)
+        """
+        if html_body is not None and plain_body is not None:
+            body_part = MIMEMultipart('alternative')
+            body_part.attach(MIMEText(plain_body, 'plain', _UTF8))
+            body_part.attach(MIMEText(html_body, 'html', _UTF8))
+            return body_part
         
-        # 참조
-        if msg.cc:
-            eml['Cc'] = msg.cc
+        if html_body is not None:
+            return MIMEText(html_body, 'html', _UTF8)
         
-        # 숨은 참조
-        if msg.bcc:
-            eml['Bcc'] = msg.bcc
+        return MIMEText(plain_body or '', 'plain', _UTF8)
+    
+    def _attachment_count(self, msg) -> int:
+        """첨부파일 개수 (첨부파일 객체를 만들지 않고 MSG 속성에서 읽음)"""
+        try:
+            return msg.props.attachmentCount
+        except Exception:
+            return len(msg.attachments or [])
+    
+    def _set_headers(self, eml, msg):
+        """이메일 헤더 설정"""
         
-        # 제목
-        if msg.subject:
-            eml['Subject'] = msg.subject
+        # 각 속성은 한 번씩만 읽음
+        # 발신자(sender는 이미 "이름 <이메일>" 형식의 문자열), 수신자, 참조, 숨은 참조, 제목
+        for header, value in (
+            ('From', msg.sender),
+            ('To', msg.to),
+            ('Cc', msg.cc),
+            ('Bcc', msg.bcc),
+            ('Subject', msg.subject),
+        ):
+            if value:
+                eml[header] = value
         
         # 날짜
-        if msg.date:
+        date = msg.date
+        if date:
             try:
-                if isinstance(msg.date, datetime):
-                    eml['Date'] = formatdate(msg.date.timestamp(), localtime=True)
-                elif isinstance(msg.date, str):
-                    eml['Date'] = msg.date
+                if isinstance(date, datetime):
+                    eml['Date'] = formatdate(date.timestamp(), localtime=True)
+                elif isinstance(date, str):
+                    eml['Date'] = date
                 else:
-                    eml['Date'] = str(msg.date)
+                    eml['Date'] = str(date)
             except Exception:
                 eml['Date'] = formatdate(localtime=True)
         else:
             eml['Date'] = formatdate(localtime=True)
         
         # Message-ID
-        if hasattr(msg, 'messageId') and msg.messageId:
-            eml['Message-ID'] = msg.messageId
+        message_id = getattr(msg, 'messageId', None)
+        if message_id:
+            eml['Message-ID'] = message_id
         
         # 우선순위 (있는 경우)
-        if hasattr(msg, 'importance') and msg.importance:
-            importance_map = {0: 'low', 1: 'normal', 2: 'high'}
-            priority = importance_map.get(msg.importance, 'normal')
+        importance = getattr(msg, 'importance', None)
+        if importance:
+            priority = self.IMPORTANCE_MAP.get(importance, 'normal')
             if priority != 'normal':
-                eml['X-Priority'] = {'low': '5', 'high': '1'}.get(priority, '3')
+                eml['X-Priority'] = self.PRIORITY_MAP.get(priority, '3')
                 eml['Importance'] = priority.capitalize()
     
-    def _add_attachments(self, eml: MIMEMultipart, msg):
-        """첨부파일 추가"""
+    def _add_attachments(self, eml: MIMEMultipart, msg, attachments=None):
+        """첨부파일 추가 (attachments: 이미 가져온 msg.attachments)"""
+        
+        if attachments is None:
+            attachments = msg.attachments
         
-        if not msg.attachments:
+        if not attachments:
             return
         
-        for attachment in msg.attachments:
+        for attachment in attachments:
             try:
-                # 첨부파일 데이터 가져오기
-                if hasattr(attachment, 'data') and attachment.data:
-                    data = attachment.data
-                elif hasattr(attachment, '_data') and attachment._data:
-                    data = attachment._data
-                else:
-                    self.log(f"첨부파일 데이터 없음: {getattr(attachment, 'longFilename', 'unknown')}")
+                # 첨부파일 데이터, 파일명, MIME 타입을 한 번에 가져오기
+                data, filename, content_type = _attachment_info(attachment)
+                if not data:
+                    self.log(f"첨부파일 데이터 없음: {filename}")
                     continue
                 
-                # 파일명 결정
-                filename = getattr(attachment, 'longFilename', None) or \
-                          getattr(attachment, 'shortFilename', None) or \
-                          getattr(attachment, 'name', None) or \
-                          'attachment'
-                
-                # MIME 타입 결정
-                content_type = getattr(attachment, 'mimetype', None) or 'application/octet-stream'
-                
                 # 첨부파일 MIME 파트 생성
                 maintype, subtype = content_type.split('/', 1) if '/' in content_type else ('application', 'octet-stream')
                 
-                if maintype == 'text':
-                    part = MIMEText(data.decode('utf-8', errors='replace'), subtype, 'utf-8')
-                else:
-                    part = MIMEBase(maintype, subtype)
-                    part.set_payload(data)
-                    encoders.encode_base64(part)
+                # 큰 첨부파일은 따로 저장하고 참조만 포함 (base64 인코딩 생략)
+                if self.extract_dir and len(data) >= EXTRACT_MIN_SIZE:
+                    eml.attach(self._external_attachment(data, filename, maintype, subtype))
+                    self.log(f"첨부파일 분리 저장: {filename}")
+                    continue
+                
+                # 텍스트 첨부파일도 원본 바이트 그대로 base64로 담음
+                # (문자 인코딩을 알 수 없으므로 디코딩/재인코딩하지 않음 - cp949 등 보존)
+                part = MIMEBase(maintype, subtype)
+                _encode_base64(part, data)
                 
                 # Content-Disposition 헤더 설정
                 part.add_header('Content-Disposition', 'attachment', filename=filename)
@@ -290,7 +424,33 @@ class MSGtoEMLConverter:
                 self.log(f"첨부파일 처리 오류: {e}")
                 continue
     
-    def convert_directory(self, directory: str, recursive: bool = False, output_dir: str = None) -> list:
+    def _external_attachment(self, data: bytes, filename: str, maintype: str, subtype: str):
+        """
+        첨부파일을 extract_dir에 저장하고, 그 파일을 가리키는
+        message/external-body (access-type=local-file) 파트 반환
+        """
+        self.extract_dir.mkdir(parents=True, exist_ok=True)
+        
+        # 같은 이름의 첨부파일이 겹치지 않도록 앞에 임의의 값을 붙임
+        safe_name = _UNSAFE_FILENAME_RE.sub('_', filename).strip(' .') or 'attachment'
+        out_path = self.extract_dir / f"{uuid.uuid4().hex[:8]}_{safe_name}"
+        with open(out_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        
+        # 참조 대상 파일의 형식/이름은 안쪽 헤더에 기록 (본문은 비어 있음)
+        inner = MIMEBase(maintype, subtype)
+        inner.add_header('Content-Disposition', 'attachment', filename=filename)
+        inner.set_payload('')
+        
+        part = MIMEBase('message', 'external-body', **{
+            'access-type': 'local-file',
+            'name': str(out_path.resolve()),
+        })
+        part.attach(inner)
+        return part
+    
+    def convert_directory(self, directory: str, recursive: bool = False, output_dir: str = None,
+                          jobs: int = None, threads: int = None) -> list:
         """
         디렉토리 내의 모든 MSG 파일을 변환
         
@@ -298,6 +458,9 @@ class MSGtoEMLConverter:
             directory: 입력 디렉토리 경로
             recursive: 하위 디렉토리 포함 여부
             output_dir: 출력 디렉토리 (None이면 원본과 동일 위치)
+            jobs: 동시에 변환할 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 처리)
+            threads: 지정하면 프로세스 대신 이 수만큼의 스레드로 변환
+                     (작은 파일이 많아 디스크 I/O가 대부분인 경우)
             
         Returns:
             변환된 파일 경로 리스트
@@ -310,14 +473,8 @@ class MSGtoEMLConverter:
         if not directory.is_dir():
             raise ValueError(f"디렉토리가 아닙니다: {directory}")
         
-        # MSG 파일 검색
-        if recursive:
-            msg_files = list(directory.rglob('*.msg')) + list(directory.rglob('*.MSG'))
-        else:
-            msg_files = list(directory.glob('*.msg')) + list(directory.glob('*.MSG'))
-        
-        # 중복 제거
-        msg_files = list(set(msg_files))
+        # MSG 파일 검색 (확장자 대소문자 무시, 한 번만 순회, Path 대신 문자열 경로 사용)
+        msg_files = list(_iter_msg_files(directory, recursive))
         
         if not msg_files:
             print(f"MSG 파일을 찾을 수 없습니다: {directory}")
@@ -328,21 +485,57 @@ class MSGtoEMLConverter:
         converted = []
         errors = []
         
+        # 출력 경로 결정
+        jobs_list = []
         for msg_file in msg_files:
-            try:
-                # 출력 경로 결정
-                if output_dir:
-                    output_path = Path(output_dir) / msg_file.with_suffix('.eml').name
-                else:
-                    output_path = msg_file.with_suffix('.eml')
-                
-                result = self.convert_file(str(msg_file), str(output_path))
-                converted.append(result)
-                print(f"✓ {msg_file.name}")
+            output_path = os.path.splitext(msg_file)[0] + '.eml'
+            if output_dir:
+                output_path = os.path.join(output_dir, os.path.basename(output_path))
+            jobs_list.append((msg_file, output_path))
+        
+        if threads:
+            workers = min(threads, len(jobs_list))
+        else:
+            workers = min(jobs or os.cpu_count() or 1, len(jobs_list))
+        
+        if workers <= 1:
+            for msg_file, output_path in jobs_list:
+                try:
+                    result = self.convert_file(msg_file, output_path)
+                    converted.append(result)
+                    print(f"✓ {os.path.basename(msg_file)}")
+                    
+                except Exception as e:
+                    errors.append((msg_file, str(e)))
+                    print(f"✗ {os.path.basename(msg_file)}: {e}")
+        else:
+            # 파일마다 독립적이므로 여러 프로세스(또는 스레드)에서 동시에 변환
+            # (extract_msg.Message는 피클링할 수 없어 작업 프로세스에서 직접 열어야 함)
+            # 결과 출력은 완료되는 순서대로 메인 프로세스에서만
+            if threads:
+                # 파일 읽기/쓰기 중에는 GIL이 풀리므로 스레드끼리 I/O가 겹침
+                executor = ThreadPoolExecutor(max_workers=workers)
+                convert = self.convert_file
+            else:
+                executor = ProcessPoolExecutor(max_workers=workers)
+                convert = partial(_convert_one, verbose=self.verbose,
+                                  extract_dir=str(self.extract_dir) if self.extract_dir else None)
+            
+            with executor:
+                futures = {
+                    executor.submit(convert, msg_file, output_path): msg_file
+                    for msg_file, output_path in jobs_list
+                }
                 
-            except Exception as e:
-                errors.append((str(msg_file), str(e)))
-                print(f"✗ {msg_file.name}: {e}")
+                for future in as_completed(futures):
+                    msg_file = futures[future]
+                    try:
+                        converted.append(future.result())
+                        print(f"✓ {os.path.basename(msg_file)}")
+                        
+                    except Exception as e:
+                        errors.append((msg_file, str(e)))
+                        print(f"✗ {os.path.basename(msg_file)}: {e}")
         
         print(f"\n변환 완료: {len(converted)}개 성공, {len(errors)}개 실패")
         
@@ -360,6 +553,7 @@ def main():
     %(prog)s ./emails/                     폴더 내 모든 MSG 파일 변환
     %(prog)s ./emails/ -r                  하위 폴더 포함 변환
     %(prog)s ./emails/ -o ./converted/     변환된 파일을 다른 폴더에 저장
+    %(prog)s ./emails/ --extract-attachments ./att/   큰 첨부파일은 따로 저장
         '''
     )
     
@@ -385,9 +579,30 @@ def main():
         help='상세 정보 출력'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='폴더 변환 시 동시에 실행할 프로세스 수 (기본값: CPU 코어 수)'
+    )
+    
+    parser.add_argument(
+        '--extract-attachments',
+        metavar='DIR',
+        default=None,
+        help='큰 첨부파일은 이 폴더에 따로 저장하고 EML에는 파일 참조만 포함'
+    )
+    
+    parser.add_argument(
+        '-t', '--threads',
+        type=int,
+        default=None,
+        help='프로세스 대신 스레드로 폴더 변환 (작은 파일이 많을 때)'
+    )
+    
     args = parser.parse_args()
     
-    converter = MSGtoEMLConverter(verbose=args.verbose)
+    converter = MSGtoEMLConverter(verbose=args.verbose, extract_dir=args.extract_attachments)
     input_path = Path(args.input)
     
     try:
@@ -407,7 +622,9 @@ def main():
             converter.convert_directory(
                 str(input_path),
                 recursive=args.recursive,
-                output_dir=str(output_dir) if output_dir else None
+                output_dir=str(output_dir) if output_dir else None,
+                jobs=args.jobs,
+                threads=args.threads
             )
         else:
             print(f"오류: 경로를 찾을 수 없습니다: {input_path}")
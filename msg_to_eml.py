@@ -19,6 +19,7 @@ import sys
 import argparse
 import email
 from email import policy
+from email.generator import Generator
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
@@ -28,6 +29,9 @@ from email import encoders
 from datetime import datetime
 from pathlib import Path
 
+# EML 파일 쓰기 버퍼 크기
+WRITE_BUFFER_SIZE = 1 << 20
+
 try:
     import extract_msg
 except ImportError:
@@ -77,16 +81,47 @@ class MSGtoEMLConverter:
         
         self.log(f"변환 중: {msg_path.name}")
         
-        # MSG 파일 열기
-        msg = extract_msg.Message(str(msg_path))
+        msg = self._open_msg(str(msg_path), msg_path.name)
+        return self._write_eml(msg, output_path)
+    
+    def convert_stream(self, msg_fp, output_path: str, name: str = 'upload.msg') -> str:
+        """
+        파일 객체(업로드 스트림 등)로부터 MSG를 읽어 EML로 변환
+        
+        Args:
+            msg_fp: MSG 데이터를 담은 탐색 가능한(seekable) 바이너리 파일 객체
+            output_path: 출력 .eml 파일 경로
+            name: 로그/오류 메시지에 표시할 원본 파일명
+            
+        Returns:
+            생성된 .eml 파일 경로
+        """
+        output_path = Path(output_path)
+        
+        self.log(f"변환 중: {name}")
+        
+        msg = self._open_msg(msg_fp, name)
+        return self._write_eml(msg, output_path)
+    
+    def _open_msg(self, source, name: str):
+        """
+        MSG 파일 열기
         
+        Args:
+            source: MSG 파일 경로 또는 탐색 가능한 바이너리 파일 객체
+            name: 로그에 표시할 파일명
+        """
+        return extract_msg.Message(source)
+    
+    def _write_eml(self, msg, output_path: Path) -> str:
+        """열린 MSG 객체를 EML 파일로 저장하고 닫음"""
         try:
             # EML 메시지 생성
             eml_message = self._create_eml_message(msg)
             
             # EML 파일로 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(eml_message.as_string())
+            with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                Generator(f, mangle_from_=False, maxheaderlen=0).flatten(eml_message)
             
             self.log(f"저장됨: {output_path.name}")
             
@@ -215,12 +250,11 @@ class MSGtoEMLConverter:
                 # 첨부파일 MIME 파트 생성
                 maintype, subtype = content_type.split('/', 1) if '/' in content_type else ('application', 'octet-stream')
                 
-                if maintype == 'text':
-                    part = MIMEText(data.decode('utf-8', errors='replace'), subtype, 'utf-8')
-                else:
-                    part = MIMEBase(maintype, subtype)
-                    part.set_payload(data)
-                    encoders.encode_base64(part)
+                # 텍스트 첨부파일도 원본 바이트 그대로 base64로 담음
+                # (문자 인코딩을 알 수 없으므로 디코딩/재인코딩하지 않음 - cp949 등 보존)
+                part = MIMEBase(maintype, subtype)
+                part.set_payload(data)
+                encoders.encode_base64(part)
                 
                 # Content-Disposition 헤더 설정
                 part.add_header('Content-Disposition', 'attachment', filename=filename)
@@ -252,14 +286,8 @@ class MSGtoEMLConverter:
         if not directory.is_dir():
             raise ValueError(f"디렉토리가 아닙니다: {directory}")
         
-        # MSG 파일 검색
-        if recursive:
-            msg_files = list(directory.rglob('*.msg')) + list(directory.rglob('*.MSG'))
-        else:
-            msg_files = list(directory.glob('*.msg')) + list(directory.glob('*.MSG'))
-        
-        # 중복 제거
-        msg_files = list(set(msg_files))
+        # MSG 파일 검색 (한 번의 scandir 순회, 확장자 대소문자 무시, 문자열 경로 사용)
+        msg_files = list(_iter_msg_files(directory, recursive))
         
         if not msg_files:
             print(f"MSG 파일을 찾을 수 없습니다: {directory}")
@@ -271,26 +299,39 @@ class MSGtoEMLConverter:
         errors = []
         
         for msg_file in msg_files:
+            name = os.path.basename(msg_file)
             try:
-                # 출력 경로 결정
+                # 출력 경로 결정 (pathlib 대신 문자열 연산)
+                output_path = os.path.splitext(msg_file)[0] + '.eml'
                 if output_dir:
-                    output_path = Path(output_dir) / msg_file.with_suffix('.eml').name
-                else:
-                    output_path = msg_file.with_suffix('.eml')
+                    output_path = os.path.join(output_dir, os.path.basename(output_path))
                 
-                result = self.convert_file(str(msg_file), str(output_path))
+                result = self.convert_file(msg_file, output_path)
                 converted.append(result)
-                print(f"✓ {msg_file.name}")
+                print(f"✓ {name}")
                 
             except Exception as e:
-                errors.append((str(msg_file), str(e)))
-                print(f"✗ {msg_file.name}: {e}")
+                errors.append((msg_file, str(e)))
+                print(f"✗ {name}: {e}")
         
         print(f"\n변환 완료: {len(converted)}개 성공, {len(errors)}개 실패")
         
         return converted
 
 
+def _iter_msg_files(root, recursive: bool):
+    """디렉토리에서 .msg 파일 경로를 차례로 반환 (확장자 대소문자 무시)"""
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if entry.name.lower().endswith('.msg'):
+                        yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='MSG to EML Converter - Microsoft Outlook .msg 파일을 .eml 형식으로 변환',
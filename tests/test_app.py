@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""app.py 웹 앱 테스트"""
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import uuid
+import zipfile
+from unittest import mock
+
+import app
+
+
+class ZipfileIsolationTest(unittest.TestCase):
+    
+    def test_import_keeps_zipfile_compression_levels(self):
+        # app import 후에도 다른 ZipFile 사용처는 zlib 압축 수준(0-9)을 그대로 사용
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
+            zipf.writestr('a.txt', 'x' * 1000)
+        with zipfile.ZipFile(buffer) as zipf:
+            self.assertEqual(zipf.read('a.txt'), b'x' * 1000)
+
+
+class DownloadAllTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.client = app.app.test_client()
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder, True)
+    
+    def _add_session(self, name: str, data: bytes) -> str:
+        file_id = str(uuid.uuid4())
+        path = os.path.join(self.folder, f"{file_id}_{name}")
+        with open(path, 'wb') as f:
+            f.write(data)
+        app.conversion_sessions.set(file_id, {
+            'original_name': name, 'eml_name': name, 'eml_path': path,
+        })
+        self.addCleanup(app.conversion_sessions.pop, file_id)
+        return file_id
+    
+    def test_zip_entries(self):
+        # 무압축(작은 파일), 미리 압축, ZipFile 직접 압축(큰 파일), 한글 이름을 모두 포함
+        contents = {
+            'small.eml': b'Subject: hi\r\n\r\nbody\r\n',
+            'medium.eml': b'Subject: medium\r\n\r\n' + b'line of text\r\n' * 2000,
+            'large.eml': os.urandom(64 * 1024),
+            '한글 메일.eml': '본문 '.encode('utf-8') * 3000,
+        }
+        file_ids = [self._add_session(name, data) for name, data in contents.items()]
+        
+        with mock.patch.object(app, 'ZIP_PRECOMPRESS_LIMIT', 48 * 1024):
+            response = self.client.post('/api/download-all', json={'file_ids': file_ids})
+            body = response.get_data()
+        
+        self.assertEqual(response.status_code, 200)
+        with zipfile.ZipFile(io.BytesIO(body)) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.namelist(), list(contents))
+            for name, data in contents.items():
+                self.assertEqual(zipf.read(name), data)
+            self.assertEqual(zipf.getinfo('small.eml').compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zipf.getinfo('medium.eml').compress_type, zipfile.ZIP_DEFLATED)
+
+
+class CleanupThreadTest(unittest.TestCase):
+    
+    def test_first_request_starts_cleanup_once(self):
+        # create_app()을 쓰지 않는 실행 방식(flask run, gunicorn app:app)에서도 정리 스레드 시작
+        client = app.app.test_client()
+        client.post('/api/clear', json={'file_ids': []})
+        client.post('/api/clear', json={'file_ids': []})
+        app.create_app()
+        
+        self.assertIsNotNone(app._cleanup_thread)
+        self.assertTrue(app._cleanup_thread.is_alive())
+        names = [thread.name for thread in threading.enumerate()]
+        self.assertEqual(names.count('cleanup'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
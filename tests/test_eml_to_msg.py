@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""converters.eml_to_msg 헤더 처리 테스트 (Outlook 없이 실행 가능한 부분만)"""
+
+import os
+import shutil
+import tempfile
+import time
+import types
+import unittest
+from email import policy
+from email.parser import BytesParser
+from unittest import mock
+
+from converters import eml_to_msg
+from converters.eml_to_msg import EMLtoMSGConverter, _decode_header_value, _part_filename
+
+
+FOLDED_EML = (
+    b"From: sender@example.com\r\n"
+    b"To: \"Kim,\r\n Minsu\" <kim@example.com>,\r\n lee@example.com\r\n"
+    b"Cc: =?utf-8?b?7ZmN6ri464+Z?=\r\n <hong@example.com>\r\n"
+    b"Subject: a very long subject line that\r\n continues here\r\n"
+    b"X-Encoded: =?utf-8?b?7ZWc6riA?=\r\n =?utf-8?b?IOygnOuqqQ==?=\r\n"
+    b"\r\n"
+    b"body\r\n"
+)
+
+
+class HeaderUnfoldTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.msg = BytesParser(policy=policy.compat32).parsebytes(FOLDED_EML)
+    
+    def test_plain_subject_is_unfolded(self):
+        self.assertEqual(_decode_header_value(self.msg['Subject']),
+                         'a very long subject line that continues here')
+    
+    def test_encoded_words_are_unfolded(self):
+        self.assertEqual(_decode_header_value(self.msg['X-Encoded']), '한글 제목')
+    
+    def test_addresses_are_unfolded(self):
+        converter = EMLtoMSGConverter.__new__(EMLtoMSGConverter)
+        self.assertEqual(converter._split_addresses(self.msg['To']),
+                         ['"Kim, Minsu" <kim@example.com>', 'lee@example.com'])
+        self.assertEqual(converter._split_addresses(self.msg['Cc']),
+                         ['"홍길동" <hong@example.com>'])
+
+
+RAW_8BIT_EML = (
+    'From: sender@example.com\r\n'
+    'To: "홍길동" <hong@example.com>, 김철수 <kim@example.com>\r\n'
+    'Subject: 안녕 테스트\r\n'
+    'Content-Type: multipart/mixed; boundary="b"\r\n'
+    '\r\n'
+    '--b\r\n'
+    'Content-Type: text/plain; charset="utf-8"\r\n'
+    '\r\n'
+    'body\r\n'
+    '--b\r\n'
+    'Content-Type: application/pdf\r\n'
+    'Content-Disposition: attachment; filename="보고서.pdf"\r\n'
+    '\r\n'
+    'data\r\n'
+    '--b--\r\n'
+)
+
+
+class Header8bitTest(unittest.TestCase):
+    """인코딩 없이 8비트 문자(한글)가 그대로 들어 있는 헤더"""
+    
+    def _parse(self, data: bytes):
+        return BytesParser(policy=policy.compat32).parsebytes(data)
+    
+    def test_utf8_subject(self):
+        msg = self._parse(RAW_8BIT_EML.encode('utf-8'))
+        self.assertEqual(_decode_header_value(msg['Subject']), '안녕 테스트')
+    
+    def test_cp949_subject(self):
+        msg = self._parse('Subject: 안녕 테스트\r\n\r\nbody\r\n'.encode('cp949'))
+        self.assertEqual(_decode_header_value(msg['Subject']), '안녕 테스트')
+    
+    def test_utf8_display_names(self):
+        msg = self._parse(RAW_8BIT_EML.encode('utf-8'))
+        converter = EMLtoMSGConverter.__new__(EMLtoMSGConverter)
+        self.assertEqual(converter._split_addresses(msg['To']),
+                         ['"홍길동" <hong@example.com>', '"김철수" <kim@example.com>'])
+    
+    def test_utf8_attachment_filename(self):
+        msg = self._parse(RAW_8BIT_EML.encode('utf-8'))
+        attachment = msg.get_payload()[1]
+        self.assertEqual(_part_filename(attachment), '보고서.pdf')
+
+
+class ComError(Exception):
+    pass
+
+
+class FakeOutlook:
+    
+    def __init__(self):
+        self.alive = True
+    
+    @property
+    def Version(self):
+        if not self.alive:
+            raise ComError("RPC server is unavailable")
+        return "16.0"
+
+
+class OutlookWorkerReconnectTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.dispatched = []
+        
+        def dispatch(name):
+            outlook = FakeOutlook()
+            self.dispatched.append(outlook)
+            return outlook
+        
+        fakes = {
+            'pythoncom': types.SimpleNamespace(CoInitialize=lambda: None, CoUninitialize=lambda: None),
+            'pywintypes': types.SimpleNamespace(com_error=ComError),
+            'win32com': types.SimpleNamespace(client=types.SimpleNamespace(Dispatch=dispatch)),
+        }
+        for name, fake in fakes.items():
+            patcher = mock.patch.object(eml_to_msg, name, fake, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        self.worker = eml_to_msg._OutlookWorker()
+        self.worker.start()
+    
+    def _run(self, func):
+        return self.worker.submit(func).result(timeout=5)
+    
+    def test_reconnects_after_outlook_exits(self):
+        first = self._run(lambda outlook: outlook)
+        self.assertIs(self._run(lambda outlook: outlook), first)
+        
+        first.alive = False  # 사용자가 Outlook을 종료
+        second = self._run(lambda outlook: outlook)
+        self.assertIsNot(second, first)
+        self.assertEqual(len(self.dispatched), 2)
+    
+    def test_com_error_drops_connection(self):
+        def fail(outlook):
+            raise ComError("call failed")
+        
+        with self.assertRaises(ComError):
+            self._run(fail)
+        self._run(lambda outlook: outlook)
+        self.assertEqual(len(self.dispatched), 2)
+
+
+class ConvertDirectoryOrderTest(unittest.TestCase):
+    
+    def test_results_follow_sorted_file_order(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        names = ['c.eml', 'a.eml', 'b.EML']
+        for name in names:
+            open(os.path.join(tmp, name), 'wb').close()
+        
+        def convert_file(eml_path, output_path):
+            # 앞 파일일수록 늦게 끝나도록 해서 완료 순서를 뒤집음
+            time.sleep({'a': 0.2, 'b': 0.1, 'c': 0.0}[os.path.basename(eml_path)[0]])
+            return output_path
+        
+        with mock.patch.object(eml_to_msg, 'OUTLOOK_AVAILABLE', True), \
+                mock.patch.object(eml_to_msg, 'check_outlook_available', return_value=(True, None)), \
+                mock.patch('builtins.print'):
+            converter = EMLtoMSGConverter()
+            converter.convert_file = convert_file
+            converted = converter.convert_directory(tmp)
+        
+        self.assertEqual([os.path.basename(p) for p in converted], ['a.msg', 'b.msg', 'c.msg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""converters.eml_to_pst EML 파싱 테스트 (Outlook 없이 실행 가능한 부분만)"""
+
+import os
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from converters import eml_to_pst
+from converters.eml_to_pst import EMLtoPSTConverter
+
+
+NESTED_EML = b"""From: sender@example.com
+To: rcpt@example.com
+Subject: nested
+MIME-Version: 1.0
+Content-Type: multipart/mixed; boundary="outer"
+
+--outer
+Content-Type: text/plain; charset="utf-8"
+
+body text
+--outer
+Content-Type: multipart/mixed; boundary="inner"
+
+--inner
+Content-Type: application/pdf; name="doc.pdf"
+Content-Disposition: attachment; filename="doc.pdf"
+Content-Transfer-Encoding: base64
+
+JVBERi0xLjQK
+--inner
+Content-Type: application/pdf; name="doc2.pdf"
+Content-Disposition: attachment; filename="doc2.pdf"
+Content-Transfer-Encoding: base64
+
+JVBERi0xLjUK
+--inner--
+--outer--
+"""
+
+
+class ParseEmlTest(unittest.TestCase):
+    
+    def _parse(self, data: bytes) -> dict:
+        fd, path = tempfile.mkstemp(suffix='.eml')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        return EMLtoPSTConverter()._parse_eml(path)
+    
+    def test_nested_multipart_attachments(self):
+        parsed = self._parse(NESTED_EML)
+        names = [part.get_filename() for part in parsed['attachment_parts']]
+        self.assertEqual(names, ['doc.pdf', 'doc2.pdf'])
+        self.assertEqual(parsed['body'].strip(), 'body text')
+        self.assertEqual(parsed['attachment_parts'][0].get_payload(decode=True), b'%PDF-1.4\n')
+
+
+class CheckOutlookAvailableTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.calls = []
+        
+        def dispatch(name):
+            self.calls.append('Dispatch')
+            return types.SimpleNamespace(GetNamespace=self.get_namespace)
+        
+        self.get_namespace = lambda name: object()
+        fakes = {
+            'OUTLOOK_AVAILABLE': True,
+            'pythoncom': types.SimpleNamespace(CoInitialize=lambda: self.calls.append('init'),
+                                               CoUninitialize=lambda: self.calls.append('uninit')),
+            'win32com': types.SimpleNamespace(client=types.SimpleNamespace(Dispatch=dispatch)),
+        }
+        for name, fake in fakes.items():
+            patcher = mock.patch.object(eml_to_pst, name, fake, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(vars(eml_to_pst._com_local).clear)
+    
+    def test_probe_releases_com_and_skips_thread_cache(self):
+        self.assertEqual(eml_to_pst.check_outlook_available(), (True, None))
+        self.assertEqual(self.calls, ['init', 'Dispatch', 'uninit'])
+        self.assertIsNone(getattr(eml_to_pst._com_local, 'outlook', None))
+        self.assertFalse(getattr(eml_to_pst._com_local, 'com_initialized', False))
+    
+    def test_probe_failure_still_uninitializes(self):
+        def fail(name):
+            raise OSError("MAPI 오류")
+        
+        self.get_namespace = fail
+        available, error = eml_to_pst.check_outlook_available()
+        self.assertFalse(available)
+        self.assertIn("MAPI 오류", error)
+        self.assertEqual(self.calls, ['init', 'Dispatch', 'uninit'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""MSG → EML 첨부파일 처리 테스트 (MSG 파일 없이 첨부파일 객체만 흉내 냄)"""
+
+import types
+import unittest
+from email.mime.multipart import MIMEMultipart
+
+import msg_to_eml
+from converters import msg_to_eml as converters_msg_to_eml
+
+
+CP949_CSV = '이름,금액\r\n홍길동,1000\r\n'.encode('cp949')
+
+
+def _attachment(data: bytes, filename: str, mimetype: str):
+    return types.SimpleNamespace(data=data, longFilename=filename, mimetype=mimetype)
+
+
+class TextAttachmentTest(unittest.TestCase):
+    
+    def _check(self, add_attachments):
+        eml = MIMEMultipart()
+        add_attachments(eml, [_attachment(CP949_CSV, 'data.csv', 'text/csv')])
+        
+        part = eml.get_payload()[0]
+        self.assertEqual(part.get_content_type(), 'text/csv')
+        self.assertEqual(part['Content-Transfer-Encoding'], 'base64')
+        self.assertEqual(part.get_payload(decode=True), CP949_CSV)
+    
+    def test_converters_keeps_small_text_bytes(self):
+        converter = converters_msg_to_eml.MSGtoEMLConverter()
+        self._check(lambda eml, attachments: converter._add_attachments(eml, None, attachments))
+    
+    def test_standalone_keeps_text_bytes(self):
+        converter = msg_to_eml.MSGtoEMLConverter()
+        self._check(lambda eml, attachments: converter._add_attachments(
+            eml, types.SimpleNamespace(attachments=attachments)))
+
+
+if __name__ == '__main__':
+    unittest.main()